@@ -13,34 +13,152 @@ Author: Rodney Dhavid Jimenez Chacin (rodhnin)
 License: MIT
 """
 
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+import re
+import socket
+from datetime import date
+from typing import Dict, Final, List, Optional
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..core.logging import get_logger
 from ..core.config import get_config
+from ..core.http_client import mount_pooled_adapter
+from ..core.findings import Finding
 
 logger = get_logger(__name__)
 
+# Apache-style listings put the file links inside a <pre> block; counting
+# <a href= hits with bytes regexes is ~10x cheaper than building a bs4/lxml
+# DOM per probed directory.
+_PRE_BLOCK_RE = re.compile(rb'<pre[^>]*>(.*?)</pre>', re.IGNORECASE | re.DOTALL)
+_ANCHOR_RE = re.compile(rb'<a\s+href=', re.IGNORECASE)
+
+# Multi-pattern indicator scans: a single compiled alternation walks the
+# body once (O(N)) instead of one full substring scan per indicator.
+_LISTING_INDICATORS = (
+    'Index of /',
+    'Parent Directory',
+    '<title>Index of',
+    'Directory Listing',
+)
+_LISTING_INDICATOR_RE = re.compile(
+    '|'.join(re.escape(ind) for ind in _LISTING_INDICATORS),
+    re.IGNORECASE
+)
+
+_DEBUG_INDICATORS = (
+    'Call Stack',
+    'Fatal error:',
+    'Warning: ',
+    'Notice: ',
+    '/var/www/',
+    '/home/',
+    'wp-config.php',
+)
+_DEBUG_INDICATOR_RE = re.compile(
+    '|'.join(re.escape(ind) for ind in _DEBUG_INDICATORS)
+)
+
+_XMLRPC_MARKER_RE = re.compile(r'xml-rpc', re.IGNORECASE)
+
+# system.listMethods probe payload, as bytes so requests skips the
+# per-call encode of the old triple-quoted literal
+_XMLRPC_LIST_METHODS: Final[bytes] = (
+    b'<?xml version="1.0"?>\n'
+    b'<methodCall>'
+    b'<methodName>system.listMethods</methodName>'
+    b'<params></params>'
+    b'</methodCall>'
+)
+
+# For the rare bs4 fallback, only parse <pre> subtrees instead of the
+# whole document
+_PRE_STRAINER = SoupStrainer('pre')
+
+
+# Static recommendation text, hoisted so findings reference one shared
+# string instead of rebuilding the same multi-line literals per call
+_REC_XMLRPC: Final[str] = (
+    'Disable XML-RPC if not needed:\n'
+    '1. Add to .htaccess:\n'
+    '   <Files xmlrpc.php>\n'
+    '     Order Deny,Allow\n'
+    '     Deny from all\n'
+    '   </Files>\n'
+    '2. Or use security plugin to disable\n'
+    '3. Or add to wp-config.php: add_filter("xmlrpc_enabled", "__return_false");\n'
+    '4. If needed for Jetpack, restrict to Jetpack IPs only'
+)
+
+_REC_DIRLIST_TMPL: Final[str] = (
+    'Disable directory listing for {path}:\n'
+    '1. Add to .htaccess: Options -Indexes\n'
+    '2. Or add blank index.html to each directory\n'
+    '3. Or configure in Apache/Nginx:\n'
+    '   Apache: <Directory> Options -Indexes </Directory>\n'
+    '   Nginx: autoindex off;'
+)
+
+_REC_DEBUG_LOG: Final[str] = (
+    'Disable debug mode in production:\n'
+    '1. Edit wp-config.php:\n'
+    "   define('WP_DEBUG', false);\n"
+    "   define('WP_DEBUG_LOG', false);\n"
+    "   define('WP_DEBUG_DISPLAY', false);\n"
+    '2. Delete existing debug.log file\n'
+    '3. Use error logging to secure location outside webroot'
+)
+
+_REC_DEBUG_DISPLAY: Final[str] = (
+    'Disable error display in production:\n'
+    '1. Set display_errors = Off in php.ini\n'
+    '2. Set WP_DEBUG_DISPLAY to false in wp-config.php\n'
+    '3. Log errors to file instead of displaying'
+)
+
+_REC_ADMIN_ACCESS: Final[str] = (
+    'Harden admin access:\n'
+    '1. Consider changing wp-admin URL (security plugin)\n'
+    '2. Implement login attempt limiting\n'
+    '3. Enable 2FA for all admin users\n'
+    '4. Use IP whitelisting if possible\n'
+    '5. Monitor for brute force attempts'
+)
+
+# Cap on how much of a response body the config checks read/scan; debug
+# indicators show up well within the first 256 KB.
+_MAX_BODY_BYTES = 262144
+
 
 class ConfigChecker:
     """
     WordPress configuration security checks.
     """
     
-    # Directories to check for listing
+    # How many recent upload years to probe for listing
+    UPLOAD_YEARS_TO_CHECK = 2
+
+    # Directories to check for listing; the uploads years are generated so
+    # the list never goes stale (probing /uploads/2024/ forever) and always
+    # targets directories that plausibly exist
     COMMON_DIRECTORIES = [
         '/wp-content/',
         '/wp-content/uploads/',
-        '/wp-content/uploads/2024/',
-        '/wp-content/uploads/2025/',
+        *[
+            f'/wp-content/uploads/{date.today().year - i}/'
+            for i in range(UPLOAD_YEARS_TO_CHECK)
+        ],
         '/wp-content/plugins/',
         '/wp-content/themes/',
         '/wp-includes/',
     ]
-    
+
+    # Cap on concurrent directory-listing probes against one host
+    DIRECTORY_PROBE_WORKERS = 4
+
     def __init__(self, config=None, http_client=None):
         """
         Initialize config checker.
@@ -54,179 +172,245 @@ class ConfigChecker:
         
         # Fallback to regular session if no client provided (for backward compatibility)
         if self.session is None:
-            self.session = requests.Session()
+            self.session = mount_pooled_adapter(requests.Session())
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
-    
-    def check_xmlrpc(self, target: str) -> List[Dict]:
+
+        # Per-scan response cache keyed by (method, url); cleared in scan()
+        self._cache: Dict[tuple, requests.Response] = {}
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET with per-scan response caching.
+
+        Repeat URLs during a single scan (e.g. the homepage) hit the
+        network only once. A duplicate fetch on a concurrent cache miss is
+        benign, so no locking is needed.
+
+        Args:
+            url: Target URL
+            **kwargs: Additional arguments for session.get()
+
+        Returns:
+            Response object
+        """
+        key = ('GET', url)
+
+        response = self._cache.get(key)
+        if response is None:
+            response = self.session.get(url, **kwargs)
+            self._cache[key] = response
+
+        return response
+
+    def _preconnect(self, target: str) -> None:
+        """
+        Warm the resolver cache and keep-alive pool for the target host.
+
+        One getaddrinfo() primes DNS and one cheap HEAD establishes the
+        TCP/TLS connection, so concurrent probes reuse a live connection
+        instead of each paying the first-request handshake.
+
+        Args:
+            target: Target URL
+        """
+        parsed = urlparse(target)
+
+        try:
+            if parsed.hostname:
+                socket.getaddrinfo(
+                    parsed.hostname,
+                    parsed.port or (443 if parsed.scheme == 'https' else 80)
+                )
+        except socket.gaierror as e:
+            logger.debug("DNS preload failed: %s", e)
+
+        try:
+            self.session.head(target, allow_redirects=False)
+        except requests.RequestException as e:
+            logger.debug("Preconnect HEAD failed: %s", e)
+
+    def check_xmlrpc(self, target: str, xmlrpc_url: Optional[str] = None) -> List[Finding]:
         """
         Check if XML-RPC is enabled and responding.
         
         Args:
             target: Target URL
+            xmlrpc_url: Precomputed probe URL (derived from target if omitted)
         
         Returns:
             List of findings
         """
         findings = []
-        xmlrpc_url = urljoin(target, '/xmlrpc.php')
+        xmlrpc_url = xmlrpc_url or urljoin(target, '/xmlrpc.php')
         
         logger.info("Checking XML-RPC interface")
         
         try:
             # Try GET request first
-            response = self.session.get(xmlrpc_url)
+            response = self._get(xmlrpc_url)
             
-            if response.status_code == 200 and 'xml-rpc' in response.text.lower():
-                # Try a simple XML-RPC call to confirm it's functional
-                xml_payload = """<?xml version="1.0"?>
-                <methodCall>
-                    <methodName>system.listMethods</methodName>
-                    <params></params>
-                </methodCall>"""
-                
+            # Case-insensitive search on the original buffer; .lower() would
+            # allocate a full copy of the body just for this check
+            if response.status_code == 200 and _XMLRPC_MARKER_RE.search(response.text):
+                # Try a simple XML-RPC call to confirm it's functional.
+                # Stream the method list with a size cap: a heavily extended
+                # install can return megabytes of XML just to be counted
                 rpc_response = self.session.post(
                     xmlrpc_url,
-                    data=xml_payload,
-                    headers={'Content-Type': 'text/xml'}
+                    data=_XMLRPC_LIST_METHODS,
+                    headers={'Content-Type': 'text/xml'},
+                    stream=True
                 )
-                
+
+                rpc_body = b''
+                try:
+                    if rpc_response.status_code == 200:
+                        for chunk in rpc_response.iter_content(8192):
+                            rpc_body += chunk
+                            if len(rpc_body) > _MAX_BODY_BYTES:
+                                break
+                finally:
+                    rpc_response.close()
+
                 if rpc_response.status_code == 200:
-                    # Count available methods
-                    methods_count = rpc_response.text.count('<string>')
-                    
-                    findings.append({
-                        'id': 'ARGUS-WP-060',
-                        'title': 'XML-RPC interface enabled',
-                        'severity': 'medium',
-                        'confidence': 'high',
-                        'description': (
+                    # Count available methods on the raw bytes; .text would
+                    # decode the whole XML body just for a substring count
+                    methods_count = rpc_body.count(b'<string>')
+
+                    findings.append(Finding(
+                        id='ARGUS-WP-060',
+                        title='XML-RPC interface enabled',
+                        severity='medium',
+                        confidence='high',
+                        description=(
                             f'WordPress XML-RPC interface is enabled and responding with {methods_count} methods. '
                             'XML-RPC can be abused for brute force attacks, DDoS amplification, and pingback exploits.'
                         ),
-                        'evidence': {
+                        evidence={
                             'type': 'url',
                             'value': xmlrpc_url,
                             'context': f'HTTP {rpc_response.status_code}, {methods_count} methods available'
                         },
-                        'recommendation': (
-                            'Disable XML-RPC if not needed:\n'
-                            '1. Add to .htaccess:\n'
-                            '   <Files xmlrpc.php>\n'
-                            '     Order Deny,Allow\n'
-                            '     Deny from all\n'
-                            '   </Files>\n'
-                            '2. Or use security plugin to disable\n'
-                            '3. Or add to wp-config.php: add_filter("xmlrpc_enabled", "__return_false");\n'
-                            '4. If needed for Jetpack, restrict to Jetpack IPs only'
-                        ),
-                        'references': [
+                        recommendation=_REC_XMLRPC,
+                        references=[
                             'https://kinsta.com/blog/xmlrpc-php/'
                         ],
-                        'affected_component': 'xmlrpc.php'
-                    })
+                        affected_component='xmlrpc.php'
+                    ))
                     
-                    logger.warning(f"XML-RPC enabled with {methods_count} methods")
+                    logger.warning("XML-RPC enabled with %d methods", methods_count)
             
             elif response.status_code == 405:  # Method not allowed
-                findings.append({
-                    'id': 'ARGUS-WP-060',
-                    'title': 'XML-RPC partially restricted (Good)',
-                    'severity': 'info',
-                    'confidence': 'high',
-                    'description': 'XML-RPC file exists but returns 405, indicating some restriction.',
-                    'recommendation': 'Verify XML-RPC is fully disabled or properly restricted.'
-                })
+                findings.append(Finding(
+                    id='ARGUS-WP-060',
+                    title='XML-RPC partially restricted (Good)',
+                    severity='info',
+                    confidence='high',
+                    description='XML-RPC file exists but returns 405, indicating some restriction.',
+                    recommendation='Verify XML-RPC is fully disabled or properly restricted.'
+                ))
         
         except requests.RequestException as e:
-            logger.debug(f"XML-RPC check failed: {e}")
+            logger.debug("XML-RPC check failed: %s", e)
         
         return findings
     
-    def check_directory_listing(self, target: str) -> List[Dict]:
+    def check_directory_listing(
+        self,
+        target: str,
+        dir_urls: Optional[Dict[str, str]] = None
+    ) -> List[Finding]:
         """
         Check for directory listing vulnerabilities.
         
         Args:
             target: Target URL
+            dir_urls: Precomputed directory -> probe URL map (derived from
+                target if omitted)
         
         Returns:
             List of findings
         """
         findings = []
         exposed_dirs = []
+
+        if dir_urls is None:
+            dir_urls = {d: urljoin(target, d) for d in self.COMMON_DIRECTORIES}
         
-        logger.info(f"Checking {len(self.COMMON_DIRECTORIES)} directories for listing")
-        
-        for directory in self.COMMON_DIRECTORIES:
-            dir_url = urljoin(target, directory)
-            
+        logger.info("Checking %d directories for listing", len(self.COMMON_DIRECTORIES))
+
+        def probe_directory(directory: str) -> Optional[Dict]:
+            dir_url = dir_urls[directory]
+
             try:
-                response = self.session.get(dir_url, allow_redirects=False)
-                
+                response = self._get(dir_url, allow_redirects=False)
+
                 if response.status_code == 200:
                     # Check if it's an actual directory listing
                     if self._is_directory_listing(response.text):
-                        exposed_dirs.append({
+                        logger.warning("✗ Directory listing enabled: %s", directory)
+                        return {
                             'path': directory,
                             'url': dir_url,
-                            'file_count': response.text.count('<a href=')
-                        })
-                        
-                        logger.warning(f"✗ Directory listing enabled: {directory}")
-            
+                            'file_count': response.content.count(b'<a href=')
+                        }
+
             except requests.RequestException as e:
-                logger.debug(f"Directory check failed for {directory}: {e}")
+                logger.debug("Directory check failed for %s: %s", directory, e)
+
+            return None
+
+        # Fan out the directory probes; max_workers caps per-host concurrency
+        # so we don't hammer the target beyond the rate limiter's burst.
+        with ThreadPoolExecutor(max_workers=self.DIRECTORY_PROBE_WORKERS) as executor:
+            for result in executor.map(probe_directory, self.COMMON_DIRECTORIES):
+                if result:
+                    exposed_dirs.append(result)
         
         # Create findings for exposed directories
         if exposed_dirs:
             for dir_info in exposed_dirs:
-                findings.append({
-                    'id': 'ARGUS-WP-061',
-                    'title': f'Directory listing enabled: {dir_info["path"]}',
-                    'severity': 'medium',
-                    'confidence': 'high',
-                    'description': (
+                findings.append(Finding(
+                    id='ARGUS-WP-061',
+                    title=f'Directory listing enabled: {dir_info["path"]}',
+                    severity='medium',
+                    confidence='high',
+                    description=(
                         f"Directory listing is enabled for {dir_info['path']}, exposing "
                         f"{dir_info['file_count']} items. Attackers can browse and download files."
                     ),
-                    'evidence': {
+                    evidence={
                         'type': 'url',
                         'value': dir_info['url'],
                         'context': f"HTTP 200, {dir_info['file_count']} items listed"
                     },
-                    'recommendation': (
-                        f"Disable directory listing for {dir_info['path']}:\n"
-                        '1. Add to .htaccess: Options -Indexes\n'
-                        '2. Or add blank index.html to each directory\n'
-                        '3. Or configure in Apache/Nginx:\n'
-                        '   Apache: <Directory> Options -Indexes </Directory>\n'
-                        '   Nginx: autoindex off;'
-                    ),
-                    'references': [
+                    recommendation=_REC_DIRLIST_TMPL.format(path=dir_info['path']),
+                    references=[
                         'https://www.acunetix.com/vulnerabilities/web/directory-listings/',
                     ],
-                    'affected_component': dir_info['path']
-                })
+                    affected_component=dir_info['path']
+                ))
             
             # Summary
-            findings.append({
-                'id': 'ARGUS-WP-062',
-                'title': f'{len(exposed_dirs)} directory/directories exposed',
-                'severity': 'medium',
-                'confidence': 'high',
-                'description': f"Found {len(exposed_dirs)} directories with listing enabled.",
-                'recommendation': 'Disable directory indexing globally across the WordPress installation.'
-            })
+            findings.append(Finding(
+                id='ARGUS-WP-062',
+                title=f'{len(exposed_dirs)} directory/directories exposed',
+                severity='medium',
+                confidence='high',
+                description=f"Found {len(exposed_dirs)} directories with listing enabled.",
+                recommendation='Disable directory indexing globally across the WordPress installation.'
+            ))
         
         return findings
     
-    def check_debug_mode(self, target: str) -> List[Dict]:
+    def check_debug_mode(self, target: str, debug_url: Optional[str] = None) -> List[Finding]:
         """
         Check if WP_DEBUG is enabled (from debug.log or HTML).
         
         Args:
             target: Target URL
+            debug_url: Precomputed debug.log URL (derived from target if omitted)
         
         Returns:
             List of findings
@@ -234,123 +418,131 @@ class ConfigChecker:
         findings = []
         
         # Check for debug.log (already checked in files.py but verify here)
-        debug_url = urljoin(target, '/wp-content/debug.log')
+        debug_url = debug_url or urljoin(target, '/wp-content/debug.log')
         
         try:
-            response = self.session.get(debug_url)
-            
-            if response.status_code == 200 and len(response.content) > 100:
-                findings.append({
-                    'id': 'ARGUS-WP-063',
-                    'title': 'Debug mode potentially enabled',
-                    'severity': 'high',
-                    'confidence': 'high',
-                    'description': 'debug.log file is accessible and contains error logs, indicating WP_DEBUG is enabled.',
-                    'evidence': {
+            # HEAD first: Content-Length answers "exists and is non-trivial"
+            # without transferring any of the log
+            status_code = None
+            log_size = 0
+            truncated = False
+
+            try:
+                head = self.session.head(debug_url, allow_redirects=False)
+                if head.status_code == 200:
+                    if 'Content-Length' in head.headers:
+                        log_size = int(head.headers['Content-Length'])
+                        status_code = 200
+                elif head.status_code not in (405, 501):
+                    # Any definitive non-200 (404, 403, ...) already answers
+                    # the probe: no accessible log, no GET needed
+                    status_code = head.status_code
+            except (requests.RequestException, ValueError):
+                pass
+
+            if status_code is None:
+                # HEAD refused (405/501) or 200 without Content-Length:
+                # stream with a hard cap, a production debug.log can be
+                # tens of megabytes
+                response = self.session.get(debug_url, stream=True)
+                status_code = response.status_code
+                try:
+                    if status_code == 200:
+                        for chunk in response.iter_content(4096):
+                            log_size += len(chunk)
+                            if log_size >= _MAX_BODY_BYTES:
+                                truncated = True
+                                break
+                finally:
+                    response.close()
+
+            if status_code == 200 and log_size > 100:
+                findings.append(Finding(
+                    id='ARGUS-WP-063',
+                    title='Debug mode potentially enabled',
+                    severity='high',
+                    confidence='high',
+                    description='debug.log file is accessible and contains error logs, indicating WP_DEBUG is enabled.',
+                    evidence={
                         'type': 'url',
                         'value': debug_url,
-                        'context': f'File size: {len(response.content)} bytes'
+                        'context': f'File size: {log_size}{"+" if truncated else ""} bytes'
                     },
-                    'recommendation': (
-                        'Disable debug mode in production:\n'
-                        '1. Edit wp-config.php:\n'
-                        "   define('WP_DEBUG', false);\n"
-                        "   define('WP_DEBUG_LOG', false);\n"
-                        "   define('WP_DEBUG_DISPLAY', false);\n"
-                        '2. Delete existing debug.log file\n'
-                        '3. Use error logging to secure location outside webroot'
-                    ),
-                    'references': [
+                    recommendation=_REC_DEBUG_LOG,
+                    references=[
                         'https://wordpress.org/documentation/article/debugging-in-wordpress/'
                     ]
-                })
+                ))
         
         except requests.RequestException:
             pass
         
         # Check HTML for debug output
         try:
-            response = self.session.get(target)
+            response = self._get(target)
             
             if response.status_code == 200:
-                debug_indicators = [
-                    'Call Stack',
-                    'Fatal error:',
-                    'Warning: ',
-                    'Notice: ',
-                    '/var/www/',
-                    '/home/',
-                    'wp-config.php',
-                ]
-                
-                found_indicators = [ind for ind in debug_indicators if ind in response.text]
-                
+                # Single pass over a bounded prefix; debug output appears
+                # early in the page, so scanning megabytes buys nothing
+                found_indicators = list(dict.fromkeys(
+                    _DEBUG_INDICATOR_RE.findall(response.text[:_MAX_BODY_BYTES])
+                ))
+
                 if found_indicators:
-                    findings.append({
-                        'id': 'ARGUS-WP-064',
-                        'title': 'PHP errors/warnings visible in HTML',
-                        'severity': 'medium',
-                        'confidence': 'medium',
-                        'description': f'PHP error output detected in HTML: {", ".join(found_indicators[:3])}',
-                        'evidence': {
+                    findings.append(Finding(
+                        id='ARGUS-WP-064',
+                        title='PHP errors/warnings visible in HTML',
+                        severity='medium',
+                        confidence='medium',
+                        description=f'PHP error output detected in HTML: {", ".join(found_indicators[:3])}',
+                        evidence={
                             'type': 'body',
                             'value': f'Found: {", ".join(found_indicators[:3])}...',
                             'context': 'Debug output in page source'
                         },
-                        'recommendation': (
-                            'Disable error display in production:\n'
-                            "1. Set display_errors = Off in php.ini\n"
-                            "2. Set WP_DEBUG_DISPLAY to false in wp-config.php\n"
-                            "3. Log errors to file instead of displaying"
-                        )
-                    })
+                        recommendation=_REC_DEBUG_DISPLAY
+                    ))
         
         except Exception:
             pass
         
         return findings
     
-    def check_admin_access(self, target: str) -> List[Dict]:
+    def check_admin_access(self, target: str, admin_url: Optional[str] = None) -> List[Finding]:
         """
         Check if wp-admin is openly accessible.
         
         Args:
             target: Target URL
+            admin_url: Precomputed wp-admin URL (derived from target if omitted)
         
         Returns:
             List of findings
         """
         findings = []
-        admin_url = urljoin(target, '/wp-admin/')
+        admin_url = admin_url or urljoin(target, '/wp-admin/')
         
         try:
-            response = self.session.get(admin_url, allow_redirects=True)
+            response = self._get(admin_url, allow_redirects=True)
             
             # If we get login page (not 403), admin is accessible
             if response.status_code == 200 and 'wp-login' in response.url.lower():
-                findings.append({
-                    'id': 'ARGUS-WP-065',
-                    'title': 'Admin login page publicly accessible',
-                    'severity': 'info',
-                    'confidence': 'high',
-                    'description': 'WordPress admin login page is accessible at default URL.',
-                    'evidence': {
+                findings.append(Finding(
+                    id='ARGUS-WP-065',
+                    title='Admin login page publicly accessible',
+                    severity='info',
+                    confidence='high',
+                    description='WordPress admin login page is accessible at default URL.',
+                    evidence={
                         'type': 'url',
                         'value': response.url,
                         'context': f'HTTP {response.status_code}'
                     },
-                    'recommendation': (
-                        'Harden admin access:\n'
-                        '1. Consider changing wp-admin URL (security plugin)\n'
-                        '2. Implement login attempt limiting\n'
-                        '3. Enable 2FA for all admin users\n'
-                        '4. Use IP whitelisting if possible\n'
-                        '5. Monitor for brute force attempts'
-                    ),
-                    'references': [
+                    recommendation=_REC_ADMIN_ACCESS,
+                    references=[
                         'https://wordpress.org/documentation/article/hardening-wordpress/#securing-wp-admin'
                     ]
-                })
+                ))
         
         except Exception:
             pass
@@ -367,30 +559,31 @@ class ConfigChecker:
         Returns:
             True if directory listing detected
         """
-        indicators = [
-            'Index of /',
-            'Parent Directory',
-            '<title>Index of',
-            'Directory Listing',
-        ]
-        
-        html_lower = html.lower()
-        
-        # Check for indicators
-        if any(ind.lower() in html_lower for ind in indicators):
+        # Check for indicators (single pass, case-insensitive)
+        if _LISTING_INDICATOR_RE.search(html):
             return True
         
-        # Check for Apache/Nginx directory listing pattern
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Apache style: <pre> with multiple <a href>
-        pre_tags = soup.find_all('pre')
-        for pre in pre_tags:
-            links = pre.find_all('a')
-            if len(links) > 2: 
+        # Check for Apache/Nginx directory listing pattern.
+        # Fast path: count anchors inside <pre>...</pre> blocks with regexes
+        # on the raw bytes instead of building a full DOM.
+        body = html.encode('utf-8', errors='replace')
+        saw_pre = False
+
+        for match in _PRE_BLOCK_RE.finditer(body):
+            saw_pre = True
+            if len(_ANCHOR_RE.findall(match.group(1))) > 2:
                 return True
-        
-        return False
+
+        if saw_pre or b'<pre' not in body.lower():
+            return False
+
+        # Ambiguous case (unclosed <pre> the regex could not bound):
+        # fall back to a real parse, restricted to <pre> content only.
+        # limit=3 stops the search as soon as enough anchors are found.
+        soup = BeautifulSoup(html, 'lxml', parse_only=_PRE_STRAINER)
+
+        # Apache style: <pre> with multiple <a href>
+        return len(soup.find_all('a', limit=3)) > 2
     
     def scan(self, target: str) -> List[Dict]:
         """
@@ -403,26 +596,106 @@ class ConfigChecker:
             List of findings
         """
         all_findings = []
-        
-        # Check XML-RPC
-        xmlrpc_findings = self.check_xmlrpc(target)
-        all_findings.extend(xmlrpc_findings)
-        
-        # Check directory listing
-        dirlist_findings = self.check_directory_listing(target)
-        all_findings.extend(dirlist_findings)
-        
-        # Check debug mode
-        debug_findings = self.check_debug_mode(target)
-        all_findings.extend(debug_findings)
-        
-        # Check admin access
-        admin_findings = self.check_admin_access(target)
-        all_findings.extend(admin_findings)
-        
+
+        # Fresh response cache for this scan
+        self._cache.clear()
+
+        # Warm DNS and the keep-alive pool once so the first real probe of
+        # each concurrent check doesn't pay resolution + handshake latency
+        self._preconnect(target)
+
+        # Prefetch the homepage into the response cache before fanning out:
+        # every check that wants the homepage then reads the one cached
+        # body instead of racing to fetch its own copy
+        try:
+            self._get(target)
+        except requests.RequestException as e:
+            logger.debug("Homepage prefetch failed: %s", e)
+
+        # Derive every probe URL once; each urljoin re-parses both of its
+        # arguments, which adds up on batch scans of many targets
+        probe_urls = {
+            'xmlrpc': urljoin(target, '/xmlrpc.php'),
+            'debug_log': urljoin(target, '/wp-content/debug.log'),
+            'admin': urljoin(target, '/wp-admin/'),
+            'dirs': {d: urljoin(target, d) for d in self.COMMON_DIRECTORIES},
+        }
+
+        # All four checks are independent probes against the same host, so
+        # run them concurrently instead of paying sum-of-RTTs serially.
+        # The shared RateLimitedSession keeps the request rate bounded.
+        checks = [
+            (self.check_xmlrpc, probe_urls['xmlrpc']),
+            (self.check_directory_listing, probe_urls['dirs']),
+            (self.check_debug_mode, probe_urls['debug_log']),
+            (self.check_admin_access, probe_urls['admin']),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            future_to_check = {
+                executor.submit(check, target, urls): check.__name__
+                for check, urls in checks
+            }
+
+            for future in as_completed(future_to_check):
+                check_name = future_to_check[future]
+                try:
+                    # scan() is the serialization boundary: checks build
+                    # slotted Finding objects, callers keep receiving dicts
+                    all_findings.extend(f.to_dict() for f in future.result())
+                except Exception as e:
+                    logger.debug("Config check %s failed: %s", check_name, e)
+
         return all_findings
 
 
+def scan_many(
+    targets: List[str],
+    concurrency: int = 8,
+    config=None,
+    http_client=None
+) -> Dict[str, List[Dict]]:
+    """
+    Run ConfigChecker.scan() across many targets concurrently.
+
+    All targets share one HTTP client (and therefore one connection pool
+    and one token bucket), so a batch is bounded by the slowest host
+    instead of the sum of all hosts. Per-host probe concurrency stays
+    capped by the checker itself.
+
+    Args:
+        targets: Target URLs
+        concurrency: Maximum targets scanned at once
+        config: Config instance
+        http_client: RateLimitedSession shared across all targets
+
+    Returns:
+        Mapping of target URL -> list of findings
+    """
+    results: Dict[str, List[Dict]] = {}
+
+    def scan_one(target: str) -> List[Dict]:
+        # Checker instances are cheap; each gets its own response cache
+        # while sharing the session and its rate limiter
+        return ConfigChecker(config=config, http_client=http_client).scan(target)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        future_to_target = {
+            executor.submit(scan_one, target): target
+            for target in targets
+        }
+
+        for future in as_completed(future_to_target):
+            target = future_to_target[future]
+            try:
+                results[target] = future.result()
+            except Exception as e:
+                logger.error("Config scan failed for %s: %s", target, e)
+                results[target] = []
+
+    return results
+
+
 if __name__ == "__main__":
     # Test config checks
     from ..core.config import Config
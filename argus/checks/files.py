@@ -14,15 +14,112 @@ Author: Rodney Dhavid Jimenez Chacin (rodhnin)
 License: MIT
 """
 
+import itertools
+import re
+from functools import lru_cache
 from typing import List, Dict, Optional
-from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from ..core.logging import get_logger
 from ..core.config import get_config
+from ..core.http_client import mount_pooled_adapter
+from ..core.findings import Finding
 
 logger = get_logger(__name__)
 
+# How much of a file body is fetched for content validation; every
+# indicator _validate_file_content looks for appears within this prefix.
+_VALIDATION_PREFIX_BYTES = 8192
+
+# Message templates for _create_finding, matched against the lowercased
+# path in order. Templates may reference {path} (as probed) and
+# {normalized} (normalized path). The last entry is the catch-all.
+_FINDING_TEMPLATES = (
+    ('wp-config',
+     'wp-config.php backup exposed',
+     "WordPress configuration file '{path}' is publicly accessible. "
+     'This file contains database credentials, security keys, and other sensitive information.',
+     'CRITICAL - Immediate action required:\n'
+     '1. Remove this file immediately\n'
+     '2. Change all database credentials\n'
+     '3. Regenerate WordPress security keys: https://api.wordpress.org/secret-key/1.1/salt/\n'
+     '4. Review access logs for potential compromise\n'
+     '5. Add deny rules to prevent future exposure'),
+    
+    ('.env',
+     'Environment file (.env) exposed',
+     'Environment configuration file contains API keys, secrets, and credentials.',
+     'CRITICAL:\n'
+     '1. Remove or restrict .env file access\n'
+     '2. Rotate all API keys and secrets\n'
+     '3. Move .env outside webroot\n'
+     '4. Add .env to .htaccess deny rules'),
+    
+    ('.sql',
+     'Database dump exposed: {normalized}',
+     'SQL database backup is publicly downloadable, containing all site data.',
+     'CRITICAL:\n'
+     '1. Delete this file immediately\n'
+     '2. Store backups outside webroot\n'
+     '3. Review for data breach\n'
+     '4. Use encrypted backups with restricted access'),
+    
+    ('debug.log',
+     'Debug log file exposed',
+     'WordPress debug log may contain sensitive information like file paths, plugin errors, and database queries.',
+     '1. Disable WP_DEBUG in production (wp-config.php)\n'
+     '2. Delete or restrict access to debug.log\n'
+     '3. Use proper error logging to secure location'),
+    
+    ('.git',
+     'Git repository exposed',
+     'Git repository files are accessible, potentially exposing source code and history.',
+     '1. Block access to .git directory in web server config\n'
+     '2. Remove .git folder from webroot\n'
+     '3. Review commit history for exposed secrets\n'
+     '4. Use deployment processes that exclude .git'),
+    
+    ('readme.html',
+     'WordPress readme.html accessible',
+     'Default WordPress readme file exposes version information.',
+     'Remove or restrict access to readme.html and license.txt files.'),
+    
+    ('xmlrpc.php',
+     'XML-RPC interface accessible',
+     'XML-RPC can be abused for brute force attacks and DDoS amplification.',
+     '1. Disable XML-RPC if not needed (via plugin or filter)\n'
+     '2. Restrict access via .htaccess if required\n'
+     '3. Use security plugins to protect against XML-RPC attacks'),
+    
+    ('',
+     'Sensitive file exposed: {normalized}',
+     "File '{normalized}' is publicly accessible.",
+     'Remove or restrict access to this file.'),
+)
+
+
+# Shared by every per-file finding; one list instead of a fresh copy
+# per finding
+_FILE_REFERENCES = [
+    'https://wordpress.org/documentation/article/hardening-wordpress/',
+    'https://developer.wordpress.org/advanced-administration/security/hardening/'
+]
+
+# Content types that are themselves sufficient evidence of an exposed
+# backup/dump - an error page never ships as one of these, so no body
+# inspection is needed
+_BINARY_CONTENT_RE = re.compile(
+    r'application/(?:zip|gzip|x-gzip|x-tar|octet-stream|sql)',
+    re.IGNORECASE
+)
+
+# SQL dump indicators, matched case-insensitively so the body prefix is
+# never copied through .upper()
+_SQL_INDICATOR_RE = re.compile(
+    r'CREATE TABLE|INSERT INTO|DROP TABLE|SELECT',
+    re.IGNORECASE
+)
+
 
 class SensitiveFilesChecker:
     """
@@ -90,10 +187,15 @@ class SensitiveFilesChecker:
         self.session = http_client  # Use rate-limited client
         self.target = target
         
-        # Fallback to regular session if no client provided
+        # Fallback to regular session if no client provided; the pooled
+        # adapter keeps connection reuse working when max_workers exceeds
+        # the requests default pool of 10
         if self.session is None:
             import requests
-            self.session = requests.Session()
+            self.session = mount_pooled_adapter(
+                requests.Session(),
+                pool_maxsize=max(16, self.config.max_workers)
+            )
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
     
@@ -103,6 +205,10 @@ class SensitiveFilesChecker:
         
         This implements IMPROV-001: Deduplication and Quality of Results.
         
+        The same paths are normalized again in _get_severity and
+        _create_finding per finding, so the pure string work is memoized
+        in _normalize_pure.
+        
         Args:
             path: File path to normalize
         
@@ -112,12 +218,18 @@ class SensitiveFilesChecker:
         if not path:
             return path
         
+        return self._normalize_pure(path, self.target or '')
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_pure(path: str, target_prefix: str) -> str:
+        """Pure, cacheable part of normalize_path."""
         # Remove whitespace
         path = path.strip()
         
         # Remove target URL prefix if present
-        if self.target and path.startswith(self.target):
-            path = path[len(self.target):]
+        if target_prefix and path.startswith(target_prefix):
+            path = path[len(target_prefix):]
         
         # Remove protocol prefixes
         for prefix in ("http://", "https://"):
@@ -133,6 +245,11 @@ class SensitiveFilesChecker:
         """
         Check if a specific file is accessible.
         
+        Existence is probed with HEAD first so the common case (404) never
+        transfers a body; for accessible files only a small ranged prefix
+        is fetched for content validation, keeping multi-megabyte SQL dumps
+        and archives off the wire.
+        
         Args:
             target: Target URL
             file_path: Relative file path
@@ -140,62 +257,127 @@ class SensitiveFilesChecker:
         Returns:
             Dict with file info or None if not accessible
         """
-        file_url = urljoin(target, file_path)
+        # Plain concatenation instead of urljoin: every probed path is
+        # relative, so there is nothing to resolve, and this skips a full
+        # urlparse per path (it also stops urljoin from eating the last
+        # path segment of a target given without a trailing slash)
+        if not target.endswith('/'):
+            target += '/'
+        file_url = target + file_path.lstrip('/')
         
         try:
-            response = self.session.get(file_url, allow_redirects=False)
+            head = self.session.head(file_url, allow_redirects=False)
             
-            # 200 = accessible, others might still be present but forbidden
-            if response.status_code == 200:
-                # Basic content validation
-                content_length = len(response.content)
-                
-                # Check if it's actually the file (not a 200 error page)
-                if content_length > 0:
-                    # For critical files, check if it contains expected patterns
-                    is_valid = self._validate_file_content(file_path, response.text)
-                    
-                    if is_valid:
+            # 200 = accessible; 405/501 = server refuses HEAD, resolve
+            # existence with the ranged GET below instead
+            if head.status_code not in (200, 405, 501):
+                return None
+            
+            # Fast path: a 200 with a binary archive/dump content type
+            # needs no body at all - headers alone confirm the exposure
+            if head.status_code == 200:
+                content_type = head.headers.get('Content-Type', '')
+                if _BINARY_CONTENT_RE.search(content_type):
+                    try:
+                        size = int(head.headers.get('Content-Length', 0))
+                    except ValueError:
+                        size = 0
+                    if size > 0:
                         return {
                             'path': file_path,
                             'url': file_url,
-                            'status_code': response.status_code,
-                            'size': content_length,
-                            'content_type': response.headers.get('Content-Type', 'unknown')
+                            'status_code': 200,
+                            'size': size,
+                            'content_type': content_type
                         }
+            
+            prefix, size = self._fetch_validation_prefix(file_url)
+            if prefix is None:
+                return None
+            
+            # Prefer the real size from HEAD over the prefix length
+            try:
+                size = int(head.headers.get('Content-Length', size))
+            except ValueError:
+                pass
+            
+            # Check if it's actually the file (not a 200 error page)
+            if size > 0 and self._validate_file_content(file_path, prefix):
+                return {
+                    'path': file_path,
+                    'url': file_url,
+                    'status_code': 200,
+                    'size': size,
+                    'content_type': head.headers.get('Content-Type', 'unknown')
+                }
         
         except Exception as e:
             logger.debug(f"File check failed for {file_path}: {e}")
         
         return None
     
+    def _fetch_validation_prefix(self, file_url: str) -> tuple:
+        """
+        Fetch the first _VALIDATION_PREFIX_BYTES of a file.
+        
+        Asks for a byte range and streams so servers that ignore Range
+        still only cost one prefix-sized read, not a full download.
+        
+        Returns:
+            Tuple of (decoded prefix, bytes read), or (None, 0) if the
+            file is not accessible
+        """
+        response = self.session.get(
+            file_url,
+            allow_redirects=False,
+            headers={'Range': f'bytes=0-{_VALIDATION_PREFIX_BYTES - 1}'},
+            stream=True
+        )
+        
+        try:
+            if response.status_code not in (200, 206):
+                return None, 0
+            
+            body = b''
+            for chunk in response.iter_content(_VALIDATION_PREFIX_BYTES):
+                body += chunk
+                if len(body) >= _VALIDATION_PREFIX_BYTES:
+                    break
+        finally:
+            response.close()
+        
+        return body.decode('utf-8', errors='replace'), len(body)
+    
     def _validate_file_content(self, file_path: str, content: str) -> bool:
         """
         Validate file content to reduce false positives.
         
         Args:
             file_path: File path being checked
-            content: Response content
+            content: Response body prefix (first _VALIDATION_PREFIX_BYTES)
         
         Returns:
             True if content appears valid for this file type
         """
+        # Lowercase the path once; the branches below reuse it
+        fp_lower = file_path.lower()
+        
         # For wp-config, check for WordPress constants
-        if 'wp-config' in file_path.lower():
+        if 'wp-config' in fp_lower:
             indicators = ['DB_NAME', 'DB_USER', 'DB_PASSWORD', 'DB_HOST']
             return any(ind in content for ind in indicators)
         
         # For .env, check for KEY=VALUE format
         if '.env' in file_path:
-            return '=' in content and '\n' in content
+            head = content[:4096]
+            return '=' in head and '\n' in head
         
-        # For SQL dumps, check for SQL keywords
-        if file_path.endswith('.sql'):
-            indicators = ['CREATE TABLE', 'INSERT INTO', 'DROP TABLE', 'SELECT']
-            return any(ind in content.upper() for ind in indicators)
+        # For SQL dumps, check for SQL keywords without upper-casing the body
+        if fp_lower.endswith('.sql'):
+            return _SQL_INDICATOR_RE.search(content) is not None
         
         # For readme, check for WordPress version
-        if 'readme' in file_path.lower():
+        if 'readme' in fp_lower:
             return 'wordpress' in content.lower()
         
         # For .git files
@@ -203,7 +385,7 @@ class SensitiveFilesChecker:
             return 'ref:' in content or '[core]' in content
         
         # For debug.log, check for date/error patterns
-        if 'debug.log' in file_path:
+        if 'debug.log' in fp_lower:
             return any(x in content for x in ['[', ']', 'PHP', 'Warning', 'Error'])
         
         # Default: assume valid if not HTML error page
@@ -221,55 +403,71 @@ class SensitiveFilesChecker:
         """
         findings = []
         
-        # Store target for normalization
+        # Store target for normalization; drop cached normalizations from
+        # any previous target so the prefix stripping stays correct
         self.target = target
+        self._normalize_pure.cache_clear()
         
-        normalized_config_paths = [self.normalize_path(p) for p in self.config.wp_common_paths]
-        normalized_backup_patterns = [self.normalize_path(p) for p in self.BACKUP_PATTERNS]
-        
-        # Combine and deduplicate
-        all_paths = list(set(normalized_config_paths + normalized_backup_patterns))
+        # Normalize and dedup the per-target config paths, then union the
+        # backup patterns normalized once at import (IMPROV-001)
+        all_paths = {
+            normalized
+            for normalized in map(self.normalize_path, self.config.wp_common_paths)
+            if normalized
+        } | _BACKUP_NORMALIZED
         
         logger.info(f"Checking {len(all_paths)} sensitive file paths (deduplicated)")
         
-        # Check files concurrently
-        exposed_files = []
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_path = {
-                executor.submit(self.check_file, target, path): path
-                for path in all_paths
-            }
-            
-            for future in as_completed(future_to_path):
-                path = future_to_path[future]
-                try:
-                    result = future.result()
-                    if result:
-                        exposed_files.append(result)
-                        logger.warning(f"✗ Exposed file: {result['path']}")
-                except Exception as e:
-                    logger.debug(f"Error checking {path}: {e}")
-        
-        # Create findings for each exposed file
-        for file_info in exposed_files:
-            severity = self._get_severity(file_info['path'])
-            finding = self._create_finding(file_info, severity)
-            findings.append(finding)
+        # Check files concurrently. All workers share the one rate-limited
+        # session, so probes multiplex over its keep-alive connection pool
+        # instead of handshaking per worker; the pool is bounded by
+        # max_workers and never oversized for short path lists.
+        exposed_count = 0
+        critical_count = 0
+        pool_size = min(self.config.max_workers, len(all_paths)) or 1
+        path_iter = iter(all_paths)
+        pending = {}
+        # Submit in a sliding window of 2x the pool instead of
+        # materializing a future per path upfront, so memory scales with
+        # concurrency rather than wordlist size
+        window = pool_size * 2
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            while True:
+                for path in itertools.islice(path_iter, window - len(pending)):
+                    pending[executor.submit(self.check_file, target, path)] = path
+                
+                if not pending:
+                    break
+                
+                # Convert results to findings as they complete; running
+                # counters replace a second pass over an intermediate list
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        result = future.result()
+                        if result:
+                            logger.warning(f"✗ Exposed file: {result['path']}")
+                            severity = self._get_severity(result['path'])
+                            findings.append(self._create_finding(result, severity))
+                            exposed_count += 1
+                            if severity == 'critical':
+                                critical_count += 1
+                    except Exception as e:
+                        logger.debug(f"Error checking {path}: {e}")
         
         # Add summary if files found
-        if exposed_files:
-            critical_count = sum(1 for f in exposed_files if self._get_severity(f['path']) == 'critical')
-            
-            findings.append({
-                'id': 'ARGUS-WP-031',
-                'title': f'{len(exposed_files)} sensitive file(s) exposed',
-                'severity': 'critical' if critical_count > 0 else 'high',
-                'confidence': 'high',
-                'description': (
-                    f"Found {len(exposed_files)} publicly accessible sensitive files. "
+        if exposed_count:
+            findings.append(Finding(
+                id='ARGUS-WP-031',
+                title=f'{exposed_count} sensitive file(s) exposed',
+                severity='critical' if critical_count > 0 else 'high',
+                confidence='high',
+                description=(
+                    f"Found {exposed_count} publicly accessible sensitive files. "
                     f"{critical_count} are critical (contain credentials/secrets)."
                 ),
-                'recommendation': (
+                recommendation=(
                     'URGENT: Secure or remove all exposed files:\n'
                     '1. Block access via .htaccess or web server config\n'
                     '2. Move sensitive files outside webroot\n'
@@ -277,19 +475,21 @@ class SensitiveFilesChecker:
                     '4. Regenerate compromised credentials\n'
                     '5. Enable proper file permissions (644 for files, 755 for dirs)'
                 )
-            })
+            ))
         else:
             # Good practice finding
-            findings.append({
-                'id': 'ARGUS-WP-030',
-                'title': 'No sensitive files exposed (Good practice)',
-                'severity': 'info',
-                'confidence': 'high',
-                'description': 'No sensitive files were publicly accessible.',
-                'recommendation': 'Continue protecting sensitive files and regularly audit file permissions.'
-            })
-        
-        return findings
+            findings.append(Finding(
+                id='ARGUS-WP-030',
+                title='No sensitive files exposed (Good practice)',
+                severity='info',
+                confidence='high',
+                description='No sensitive files were publicly accessible.',
+                recommendation='Continue protecting sensitive files and regularly audit file permissions.'
+            ))
+        
+        # Findings stay slotted dataclasses internally; the reporting
+        # pipeline gets plain dicts at the scan boundary
+        return [finding.to_dict() for finding in findings]
     
     def _get_severity(self, file_path: str) -> str:
         """Determine severity for a file path."""
@@ -314,107 +514,38 @@ class SensitiveFilesChecker:
         
         return 'low'
     
-    def _create_finding(self, file_info: Dict, severity: str) -> Dict:
-        """Create a finding dict for an exposed file."""
+    def _create_finding(self, file_info: Dict, severity: str) -> Finding:
+        """Create a Finding for an exposed file."""
         file_path = file_info['path']
         
         # IMPROV-001: Normalize path for affected_component to avoid duplicates
         normalized_path = self.normalize_path(file_path)
         
-        # Customize messages based on file type
-        if 'wp-config' in file_path.lower():
-            title = 'wp-config.php backup exposed'
-            description = (
-                f"WordPress configuration file '{file_path}' is publicly accessible. "
-                "This file contains database credentials, security keys, and other sensitive information."
-            )
-            recommendation = (
-                'CRITICAL - Immediate action required:\n'
-                '1. Remove this file immediately\n'
-                '2. Change all database credentials\n'
-                '3. Regenerate WordPress security keys: https://api.wordpress.org/secret-key/1.1/salt/\n'
-                '4. Review access logs for potential compromise\n'
-                '5. Add deny rules to prevent future exposure'
-            )
-        
-        elif '.env' in file_path:
-            title = 'Environment file (.env) exposed'
-            description = 'Environment configuration file contains API keys, secrets, and credentials.'
-            recommendation = (
-                'CRITICAL:\n'
-                '1. Remove or restrict .env file access\n'
-                '2. Rotate all API keys and secrets\n'
-                '3. Move .env outside webroot\n'
-                '4. Add .env to .htaccess deny rules'
-            )
-        
-        elif file_path.endswith('.sql'):
-            title = f'Database dump exposed: {normalized_path}'
-            description = 'SQL database backup is publicly downloadable, containing all site data.'
-            recommendation = (
-                'CRITICAL:\n'
-                '1. Delete this file immediately\n'
-                '2. Store backups outside webroot\n'
-                '3. Review for data breach\n'
-                '4. Use encrypted backups with restricted access'
-            )
-        
-        elif 'debug.log' in file_path:
-            title = 'Debug log file exposed'
-            description = 'WordPress debug log may contain sensitive information like file paths, plugin errors, and database queries.'
-            recommendation = (
-                '1. Disable WP_DEBUG in production (wp-config.php)\n'
-                '2. Delete or restrict access to debug.log\n'
-                '3. Use proper error logging to secure location'
-            )
-        
-        elif '.git' in file_path:
-            title = 'Git repository exposed'
-            description = 'Git repository files are accessible, potentially exposing source code and history.'
-            recommendation = (
-                '1. Block access to .git directory in web server config\n'
-                '2. Remove .git folder from webroot\n'
-                '3. Review commit history for exposed secrets\n'
-                '4. Use deployment processes that exclude .git'
-            )
-        
-        elif 'readme.html' in file_path:
-            title = 'WordPress readme.html accessible'
-            description = 'Default WordPress readme file exposes version information.'
-            recommendation = 'Remove or restrict access to readme.html and license.txt files.'
-        
-        elif 'xmlrpc.php' in file_path:
-            title = 'XML-RPC interface accessible'
-            description = 'XML-RPC can be abused for brute force attacks and DDoS amplification.'
-            recommendation = (
-                '1. Disable XML-RPC if not needed (via plugin or filter)\n'
-                '2. Restrict access via .htaccess if required\n'
-                '3. Use security plugins to protect against XML-RPC attacks'
-            )
-        
-        else:
-            title = f'Sensitive file exposed: {normalized_path}'
-            description = f"File '{normalized_path}' is publicly accessible."
-            recommendation = 'Remove or restrict access to this file.'
-        
-        return {
-            'id': 'ARGUS-WP-030',
-            'title': title,
-            'severity': severity,
-            'confidence': 'high',
-            'description': description,
-            'evidence': {
+        # Customize messages based on file type via the precomputed
+        # template table; the empty-marker entry is the catch-all
+        fp_lower = file_path.lower()
+        for marker, title, description, recommendation in _FINDING_TEMPLATES:
+            if marker in fp_lower:
+                break
+        
+        title = title.format(path=file_path, normalized=normalized_path)
+        description = description.format(path=file_path, normalized=normalized_path)
+        
+        return Finding(
+            id='ARGUS-WP-030',
+            title=title,
+            severity=severity,
+            confidence='high',
+            description=description,
+            evidence={
                 'type': 'url',
                 'value': file_info['url'],
                 'context': f"HTTP {file_info['status_code']}, Size: {file_info['size']} bytes"
             },
-            'recommendation': recommendation,
-            'references': [
-                'https://wordpress.org/documentation/article/hardening-wordpress/',
-                'https://developer.wordpress.org/advanced-administration/security/hardening/'
-            ],
-            'affected_component': normalized_path
-        }
+            recommendation=recommendation,
+            references=_FILE_REFERENCES,
+            affected_component=normalized_path
+        )
     
     def scan(self, target: str) -> List[Dict]:
         """
@@ -427,3 +558,10 @@ class SensitiveFilesChecker:
             List of findings
         """
         return self.scan_sensitive_files(target)
+
+
+# BACKUP_PATTERNS are static relative paths, so their normalization is
+# hoisted out of the per-target scan and computed once at import
+_BACKUP_NORMALIZED = frozenset(
+    p.strip().lstrip('/').rstrip('/') for p in SensitiveFilesChecker.BACKUP_PATTERNS
+)
@@ -12,11 +12,13 @@ Author: Rodney Dhavid Jimenez Chacin (rodhnin)
 License: MIT
 """
 
+import json
 import re
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional, Dict, List, Tuple
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
 import requests  # BUG-015: Import for exception types
 
 from ..core.logging import get_logger
@@ -24,23 +26,55 @@ from ..core.config import get_config
 
 logger = get_logger(__name__)
 
+# Generator meta tag, extracted with a bytes regex rather than a full
+# BeautifulSoup parse of the document; WordPress emits the tag as
+# <meta name="generator" content="WordPress X.Y" />
+_META_GENERATOR_RE = re.compile(
+    rb'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)',
+    re.IGNORECASE
+)
+
+# On-disk version cache shared across runs (CI pipelines, schedulers):
+# entries are keyed by host and validated against the root page's
+# ETag/Last-Modified, so an unchanged target skips every version probe
+_FP_CACHE_PATH = Path.home() / '.argus' / 'fp_cache.json'
+
+# wp-includes/wp-content JS/CSS URLs carrying a ?ver= parameter
+_ASSET_VERSION_RE = re.compile(
+    rb'/wp-(?:includes|content)/(?:js|css)/[^"\']*\?ver=(\d+\.\d+(?:\.\d+)?)',
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
+class _RootPage:
+    """
+    Root-page data shared by the fingerprint checks.
+
+    Built lazily once per target: one fetch plus one pass of each regex,
+    consumed by detection, the meta-generator check and the asset check.
+    """
+
+    target: str
+    response: object
+    generator: Optional[bytes]          # content= of the generator meta tag
+    asset_versions: List[bytes] = field(default_factory=list)
+
 
 class WordPressFingerprint:
     """
     WordPress detection and version identification.
     """
     
-    # Version extraction patterns
-    VERSION_PATTERNS = [
-        # readme.html: "Version 5.8"
-        r'Version\s+(\d+\.\d+(?:\.\d+)?)',
-        # Meta generator: "WordPress 5.8"
-        r'WordPress\s+(\d+\.\d+(?:\.\d+)?)',
-        # RSS feed: "https://wordpress.org/?v=5.8"
-        r'\?v=(\d+\.\d+(?:\.\d+)?)',
-        # JS/CSS URLs: "wp-includes/js/...?ver=5.8"
-        r'ver=(\d+\.\d+(?:\.\d+)?)',
-    ]
+    # Version extraction pattern, one alternation compiled once:
+    # "Version 5.8" (readme.html), "WordPress 5.8" (meta generator),
+    # "?v=5.8" (RSS feed), "ver=5.8" (JS/CSS asset URLs).
+    # Bytes-level so matching runs on response.content without triggering
+    # requests' charset detection and full-body decode.
+    VERSION_PATTERN = re.compile(
+        rb'(?:Version\s+|WordPress\s+|\?v=|ver=)(\d+\.\d+(?:\.\d+)?)',
+        re.IGNORECASE
+    )
     
     # WordPress indicators
     WP_INDICATORS = [
@@ -51,6 +85,16 @@ class WordPressFingerprint:
         'xmlrpc.php',
     ]
     
+    # All indicators in one alternation so detection scans the homepage
+    # once instead of once per indicator; bytes-level for the same reason
+    # as VERSION_PATTERN
+    WP_INDICATOR_RE = re.compile(
+        '|'.join(map(re.escape, WP_INDICATORS)).encode('ascii')
+    )
+
+    # Lazily loaded contents of _FP_CACHE_PATH, shared process-wide
+    _fp_cache_data: Optional[Dict] = None
+    
     def __init__(self, config=None, http_client=None):
         """
         Initialize fingerprint module.
@@ -68,7 +112,57 @@ class WordPressFingerprint:
             self.session = requests.Session()
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
-    
+
+        # Per-scan response cache; detect_wordpress and the version checks
+        # all want the same root/readme/feed URLs, so each is fetched once
+        self._cache: Dict[str, requests.Response] = {}
+
+        # Lazily built root-page record (see _root)
+        self._root_page: Optional[_RootPage] = None
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET with per-scan response caching.
+
+        detect_wordpress, _check_meta_generator and _check_assets all read
+        the root page; caching collapses those into one round trip per
+        scan. Network errors propagate to the caller as before.
+
+        Args:
+            url: Target URL
+            **kwargs: Additional arguments for session.get()
+
+        Returns:
+            Response object
+        """
+        response = self._cache.get(url)
+        if response is None:
+            response = self.session.get(url, **kwargs)
+            self._cache[url] = response
+
+        return response
+
+    def _root(self, target: str) -> _RootPage:
+        """
+        Fetch and pre-digest the root page once per target.
+
+        The generator meta tag and asset ?ver= captures are extracted
+        here so the individual checks read precomputed fields instead of
+        re-scanning the body.
+        """
+        if self._root_page is None or self._root_page.target != target:
+            response = self._get(target)
+            body = response.content if response.status_code == 200 else b''
+            generator = _META_GENERATOR_RE.search(body)
+            self._root_page = _RootPage(
+                target=target,
+                response=response,
+                generator=generator.group(1) if generator else None,
+                asset_versions=_ASSET_VERSION_RE.findall(body)
+            )
+
+        return self._root_page
+
     def detect_wordpress(self, target: str) -> Tuple[bool, List[Dict]]:
         """
         Detect if target is running WordPress.
@@ -85,20 +179,16 @@ class WordPressFingerprint:
         findings = []
         is_wp = False
         
-        response = self.session.get(target)
+        response = self._root(target).response
         
         if response.status_code != 200:
             logger.warning(f"Target returned {response.status_code}")
             # Non-200 status is NOT a connection error, just not WordPress
             return False, findings
         
-        html = response.text
-        
-        # Check for WordPress indicators
-        wp_count = 0
-        for indicator in self.WP_INDICATORS:
-            if indicator in html:
-                wp_count += 1
+        # Check for WordPress indicators in a single pass over the raw
+        # body; the ASCII needles never require decoding the page
+        wp_count = len(set(self.WP_INDICATOR_RE.findall(response.content)))
         
         if wp_count >= 2:  # At least 2 indicators
             is_wp = True
@@ -122,12 +212,18 @@ class WordPressFingerprint:
         
         return is_wp, findings
     
-    def get_version(self, target: str) -> Tuple[Optional[str], List[Dict]]:
+    def get_version(self, target: str, thorough: bool = False) -> Tuple[Optional[str], List[Dict]]:
         """
         Detect WordPress version using multiple methods.
         
+        Methods are ordered cheapest-first and detection stops at the
+        first hit; one disclosed version is all the finding needs. Pass
+        thorough=True to keep probing and record every method that leaks
+        the version.
+        
         Args:
             target: Target URL
+            thorough: Try all methods even after a version is found
         
         Returns:
             Tuple of (version_string, findings_list)
@@ -136,29 +232,36 @@ class WordPressFingerprint:
         version = None
         methods_tried = []
         
-        # Method 1: Meta generator tag
-        v = self._check_meta_generator(target)
-        methods_tried.append(('meta_generator', v))
-        if v and not version:
-            version = v
-        
-        # Method 2: readme.html
-        v = self._check_readme(target)
-        methods_tried.append(('readme.html', v))
-        if v and not version:
-            version = v
-        
-        # Method 3: RSS feed
-        v = self._check_rss_feed(target)
-        methods_tried.append(('rss_feed', v))
-        if v and not version:
-            version = v
-        
-        # Method 4: Asset version parameters
-        v = self._check_assets(target)
-        methods_tried.append(('assets', v))
-        if v and not version:
-            version = v
+        # Ordered cheapest-first: the first two reuse the cached root
+        # page / a single small page, the feed check can hit 3 URLs
+        methods = [
+            ('meta_generator', self._check_meta_generator),
+            ('assets', self._check_assets),
+            ('readme.html', self._check_readme),
+            ('rss_feed', self._check_rss_feed),
+        ]
+        
+        # Cheap revalidation first: if the root page's ETag/Last-Modified
+        # matches a previous run, reuse that run's version outright
+        validator = self._root_validator(target)
+        host = urlparse(target).netloc.lower()
+        if validator:
+            cached = self._fp_cache().get(host)
+            if cached and cached.get('validator') == validator and cached.get('version'):
+                version = cached['version']
+                methods_tried.append(('cache', version))
+        
+        if not version:
+            for name, method in methods:
+                v = method(target)
+                methods_tried.append((name, v))
+                if v and not version:
+                    version = v
+                    if not thorough:
+                        break
+            
+            if version and validator:
+                self._fp_cache_store(host, validator, version)
         
         # Create finding
         if version:
@@ -205,22 +308,49 @@ class WordPressFingerprint:
         
         return version, findings
     
+    def _root_validator(self, target: str) -> Optional[str]:
+        """HEAD the root page and return its ETag/Last-Modified, if any."""
+        try:
+            response = self.session.head(target, allow_redirects=True)
+            return (
+                response.headers.get('ETag')
+                or response.headers.get('Last-Modified')
+            )
+        except Exception as e:
+            logger.debug(f"Validator HEAD failed: {e}")
+            return None
+    
+    @classmethod
+    def _fp_cache(cls) -> Dict:
+        """Load the on-disk version cache once per process."""
+        if cls._fp_cache_data is None:
+            try:
+                cls._fp_cache_data = json.loads(_FP_CACHE_PATH.read_text())
+            except (OSError, ValueError):
+                cls._fp_cache_data = {}
+        return cls._fp_cache_data
+    
+    @classmethod
+    def _fp_cache_store(cls, host: str, validator: str, version: str):
+        """Record a detected version; cache write failures are non-fatal."""
+        cls._fp_cache()[host] = {'validator': validator, 'version': version}
+        try:
+            _FP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _FP_CACHE_PATH.write_text(json.dumps(cls._fp_cache_data, indent=2))
+        except OSError as e:
+            logger.debug(f"Could not persist version cache: {e}")
+    
     def _check_meta_generator(self, target: str) -> Optional[str]:
         """Check meta generator tag for version."""
         try:
-            response = self.session.get(target)
+            generator = self._root(target).generator
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                generator = soup.find('meta', {'name': 'generator'})
-                
-                if generator and generator.get('content'):
-                    content = generator['content']
-                    for pattern in self.VERSION_PATTERNS:
-                        match = re.search(pattern, content, re.IGNORECASE)
-                        if match:
-                            logger.debug(f"Version found in meta generator: {match.group(1)}")
-                            return match.group(1)
+            if generator:
+                match = self.VERSION_PATTERN.search(generator)
+                if match:
+                    version = match.group(1).decode('ascii')
+                    logger.debug(f"Version found in meta generator: {version}")
+                    return version
         
         except Exception as e:
             logger.debug(f"Meta generator check failed: {e}")
@@ -232,14 +362,14 @@ class WordPressFingerprint:
         readme_url = urljoin(target, '/readme.html')
         
         try:
-            response = self.session.get(readme_url)
+            response = self._get(readme_url)
             
             if response.status_code == 200:
-                for pattern in self.VERSION_PATTERNS:
-                    match = re.search(pattern, response.text, re.IGNORECASE)
-                    if match:
-                        logger.debug(f"Version found in readme.html: {match.group(1)}")
-                        return match.group(1)
+                match = self.VERSION_PATTERN.search(response.content)
+                if match:
+                    version = match.group(1).decode('ascii')
+                    logger.debug(f"Version found in readme.html: {version}")
+                    return version
         
         except Exception as e:
             logger.debug(f"readme.html check failed: {e}")
@@ -256,15 +386,15 @@ class WordPressFingerprint:
         
         for feed_url in feed_urls:
             try:
-                response = self.session.get(feed_url)
+                response = self._get(feed_url)
                 
                 if response.status_code == 200:
                     # Look for generator tag in RSS
-                    for pattern in self.VERSION_PATTERNS:
-                        match = re.search(pattern, response.text, re.IGNORECASE)
-                        if match:
-                            logger.debug(f"Version found in RSS feed: {match.group(1)}")
-                            return match.group(1)
+                    match = self.VERSION_PATTERN.search(response.content)
+                    if match:
+                        version = match.group(1).decode('ascii')
+                        logger.debug(f"Version found in RSS feed: {version}")
+                        return version
             
             except Exception as e:
                 logger.debug(f"RSS feed check failed for {feed_url}: {e}")
@@ -274,22 +404,14 @@ class WordPressFingerprint:
     def _check_assets(self, target: str) -> Optional[str]:
         """Check JS/CSS assets for version parameters."""
         try:
-            response = self.session.get(target)
+            matches = self._root(target).asset_versions
             
-            if response.status_code == 200:
-                # Look for wp-includes/js or wp-includes/css with ver= parameter
-                matches = re.findall(
-                    r'/wp-(?:includes|content)/(?:js|css)/[^"\']*\?ver=(\d+\.\d+(?:\.\d+)?)',
-                    response.text,
-                    re.IGNORECASE
-                )
-                
-                if matches:
-                    # Return most common version
-                    from collections import Counter
-                    version = Counter(matches).most_common(1)[0][0]
-                    logger.debug(f"Version found in assets: {version}")
-                    return version
+            if matches:
+                # Return most common version
+                from collections import Counter
+                version = Counter(matches).most_common(1)[0][0].decode('ascii')
+                logger.debug(f"Version found in assets: {version}")
+                return version
         
         except Exception as e:
             logger.debug(f"Assets check failed: {e}")
@@ -310,7 +432,14 @@ class WordPressFingerprint:
             requests.RequestException: On connection/network errors
         """
         all_findings = []
-        
+
+        # Fresh response cache and root-page record for this scan. The
+        # cache also guarantees the root page fetched by detect_wordpress
+        # below is the exact response the version checks read - one GET
+        # serves both phases
+        self._cache.clear()
+        self._root_page = None
+
         # Let them propagate to scanner.py for proper error handling
         is_wp, wp_findings = self.detect_wordpress(target)
         all_findings.extend(wp_findings)
@@ -15,74 +15,151 @@ Author: Rodney Dhavid Jimenez Chacin (rodhnin)
 License: MIT
 """
 
+import copy
+import re
+import threading
+import time
+from collections import namedtuple
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
 from ..core.logging import get_logger
 from ..core.config import get_config
+from ..core.http_client import mount_pooled_adapter
+from ..core.findings import Finding
 
 logger = get_logger(__name__)
 
+# Validation patterns, compiled once instead of per _validate_header call
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+_CSP_UNSAFE_RE = re.compile(r'unsafe-(inline|eval)')
+
+# Process-wide TTL cache of scan results. Batch runs and the multi-tool
+# pipelines hit the same host repeatedly within minutes; header posture
+# does not change at that timescale, so repeats skip the network
+# entirely. Entries are deep-copied on both store and hit so callers can
+# mutate their findings freely.
+_SCAN_CACHE: Dict[str, tuple] = {}
+_SCAN_CACHE_LOCK = threading.Lock()
+_SCAN_CACHE_TTL = 300.0
+_SCAN_CACHE_MAX = 1024
+
+# Severity weight per cookie issue flag; 2 maps to 'medium', 1 to 'low'.
+# A data map instead of a heuristic over the issue strings, so adding or
+# reordering flags cannot change finding severity by accident
+_COOKIE_FLAG_SEVERITY = {
+    'missing_secure': 2,
+    'missing_httponly': 2,
+    'missing_samesite': 1,
+    'samesite_none_insecure': 2,
+}
+
+# Static recommendation text shared by every summary finding
+_REC_BEST_PRACTICES = (
+    'Implement security headers best practices:\n'
+    '1. Add all missing security headers\n'
+    '2. Strengthen weak header configurations\n'
+    '3. Set proper cookie security flags\n'
+    '4. Test configuration at https://securityheaders.com/\n'
+    '5. Use WordPress security plugins for easy header management'
+)
+
+# Reference lists shared across findings instead of re-allocated per finding
+_HEADER_REFS = [
+    'https://owasp.org/www-project-secure-headers/',
+    'https://securityheaders.com/'
+]
+_COOKIE_REFS = [
+    'https://owasp.org/www-community/controls/SecureCookieAttribute',
+    'https://developer.mozilla.org/en-US/docs/Web/HTTP/Cookies'
+]
+
+# One spec per checked header; attribute access in the scan loop beats
+# two dict lookups per field, and the tuple is immutable
+HeaderSpec = namedtuple(
+    'HeaderSpec',
+    'name name_lower display description recommendation severity_missing only_https'
+)
+
 
 class SecurityHeadersChecker:
     """
     Checks security-related HTTP headers.
     """
     
-    # Header importance and recommendations
-    HEADER_CONFIGS = {
-        'Strict-Transport-Security': {
-            'severity_missing': 'medium',
-            'name_display': 'HSTS (HTTP Strict Transport Security)',
-            'description': 'Forces browsers to use HTTPS, preventing protocol downgrade attacks.',
-            'recommendation': 'Add header: Strict-Transport-Security: max-age=31536000; includeSubDomains; preload',
-            'only_https': True,
-        },
-        'Content-Security-Policy': {
-            'severity_missing': 'medium',
-            'name_display': 'Content Security Policy (CSP)',
-            'description': 'Mitigates XSS, clickjacking, and other code injection attacks.',
-            'recommendation': "Add CSP header with appropriate directives (e.g., default-src 'self')",
-            'only_https': False,
-        },
-        'X-Frame-Options': {
-            'severity_missing': 'medium',
-            'name_display': 'X-Frame-Options',
-            'description': 'Prevents clickjacking attacks by controlling iframe embedding.',
-            'recommendation': 'Add header: X-Frame-Options: SAMEORIGIN or DENY',
-            'only_https': False,
-        },
-        'X-Content-Type-Options': {
-            'severity_missing': 'low',
-            'name_display': 'X-Content-Type-Options',
-            'description': 'Prevents MIME-sniffing attacks.',
-            'recommendation': 'Add header: X-Content-Type-Options: nosniff',
-            'only_https': False,
-        },
-        'X-XSS-Protection': {
-            'severity_missing': 'low',
-            'name_display': 'X-XSS-Protection (Legacy)',
-            'description': 'Legacy XSS filter (modern browsers use CSP instead).',
-            'recommendation': 'Add header: X-XSS-Protection: 1; mode=block (or rely on CSP)',
-            'only_https': False,
-        },
-        'Referrer-Policy': {
-            'severity_missing': 'low',
-            'name_display': 'Referrer-Policy',
-            'description': 'Controls how much referrer information is shared.',
-            'recommendation': 'Add header: Referrer-Policy: strict-origin-when-cross-origin',
-            'only_https': False,
-        },
-        'Permissions-Policy': {
-            'severity_missing': 'info',
-            'name_display': 'Permissions-Policy',
-            'description': 'Controls which browser features can be used.',
-            'recommendation': 'Add header with appropriate feature restrictions',
-            'only_https': False,
-        },
-    }
+    # Header importance and recommendations. A flat tuple on purpose:
+    # both extract_headers and scan() iterate it directly, so no keys
+    # view or per-call iterator setup is ever built
+    HEADER_SPECS = (
+        HeaderSpec(
+            name='Strict-Transport-Security',
+            name_lower='strict-transport-security',
+            display='HSTS (HTTP Strict Transport Security)',
+            description='Forces browsers to use HTTPS, preventing protocol downgrade attacks.',
+            recommendation='Add header: Strict-Transport-Security: max-age=31536000; includeSubDomains; preload',
+            severity_missing='medium',
+            only_https=True,
+        ),
+        HeaderSpec(
+            name='Content-Security-Policy',
+            name_lower='content-security-policy',
+            display='Content Security Policy (CSP)',
+            description='Mitigates XSS, clickjacking, and other code injection attacks.',
+            recommendation="Add CSP header with appropriate directives (e.g., default-src 'self')",
+            severity_missing='medium',
+            only_https=False,
+        ),
+        HeaderSpec(
+            name='X-Frame-Options',
+            name_lower='x-frame-options',
+            display='X-Frame-Options',
+            description='Prevents clickjacking attacks by controlling iframe embedding.',
+            recommendation='Add header: X-Frame-Options: SAMEORIGIN or DENY',
+            severity_missing='medium',
+            only_https=False,
+        ),
+        HeaderSpec(
+            name='X-Content-Type-Options',
+            name_lower='x-content-type-options',
+            display='X-Content-Type-Options',
+            description='Prevents MIME-sniffing attacks.',
+            recommendation='Add header: X-Content-Type-Options: nosniff',
+            severity_missing='low',
+            only_https=False,
+        ),
+        HeaderSpec(
+            name='X-XSS-Protection',
+            name_lower='x-xss-protection',
+            display='X-XSS-Protection (Legacy)',
+            description='Legacy XSS filter (modern browsers use CSP instead).',
+            recommendation='Add header: X-XSS-Protection: 1; mode=block (or rely on CSP)',
+            severity_missing='low',
+            only_https=False,
+        ),
+        HeaderSpec(
+            name='Referrer-Policy',
+            name_lower='referrer-policy',
+            display='Referrer-Policy',
+            description='Controls how much referrer information is shared.',
+            recommendation='Add header: Referrer-Policy: strict-origin-when-cross-origin',
+            severity_missing='low',
+            only_https=False,
+        ),
+        HeaderSpec(
+            name='Permissions-Policy',
+            name_lower='permissions-policy',
+            display='Permissions-Policy',
+            description='Controls which browser features can be used.',
+            recommendation='Add header with appropriate feature restrictions',
+            severity_missing='info',
+            only_https=False,
+        ),
+    )
+    
+    __slots__ = ('config', 'session', 'timeout')
     
     def __init__(self, config=None, http_client=None):
         """
@@ -95,107 +172,207 @@ class SecurityHeadersChecker:
         self.config = config or get_config()
         self.session = http_client  # Use rate-limited client
         
-        # Fallback to regular session if no client provided (for backward compatibility)
+        # Explicit (connect, read) timeout on every request: a single
+        # stalled target must not hold a scan thread indefinitely. The
+        # rate-limited client applies the same defaults itself, but the
+        # fallback session below would otherwise wait forever
+        self.timeout = (self.config.timeout_connect, self.config.timeout_read)
+        
+        # Fallback to regular session if no client provided (for backward
+        # compatibility). The pooled adapter keeps sockets alive between
+        # probes, so reusing one checker across targets amortizes the
+        # TCP/TLS handshakes
         if self.session is None:
-            self.session = requests.Session()
+            self.session = mount_pooled_adapter(requests.Session(), pool_maxsize=32)
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
     
+    def extract_headers(self, response: requests.Response) -> Dict[str, Optional[str]]:
+        """
+        Extract security headers from an already-fetched response.
+        
+        Args:
+            response: Response object for the target
+        
+        Returns:
+            Dictionary of header_name: header_value
+        """
+        # Read the underlying urllib3 HTTPHeaderDict when present rather
+        # than the CaseInsensitiveDict wrapper requests builds on top of
+        # it, then case-fold in one pass instead of per configured header
+        raw = getattr(response, 'raw', None)
+        source = getattr(raw, 'headers', None)
+        if source is None:
+            source = response.headers
+        
+        lower_map = {k.lower(): v for k, v in source.items()}
+        
+        headers = {
+            spec.name: lower_map.get(spec.name_lower)
+            for spec in self.HEADER_SPECS
+        }
+        
+        # Also check for alternative/deprecated names
+        if not headers.get('Content-Security-Policy'):
+            headers['Content-Security-Policy'] = (
+                lower_map.get('x-content-security-policy') or
+                lower_map.get('x-webkit-csp')
+            )
+        
+        logger.debug(f"Retrieved {len([v for v in headers.values() if v])} security headers")
+        
+        return headers
+    
     def check_headers(self, target: str) -> Dict[str, Optional[str]]:
         """
         Fetch and return security headers from target.
         
+        Thin wrapper kept for backward compatibility; scan() fetches the
+        target once and calls extract_headers directly.
+        
         Args:
             target: Target URL
         
         Returns:
             Dictionary of header_name: header_value
         """
-        headers = {}
-        
         try:
-            response = self.session.get(target, allow_redirects=True)
-            
-            # Extract security-related headers (case-insensitive)
-            for header_name in self.HEADER_CONFIGS.keys():
-                value = response.headers.get(header_name)
-                headers[header_name] = value
-            
-            # Also check for alternative/deprecated names
-            if not headers.get('Content-Security-Policy'):
-                headers['Content-Security-Policy'] = (
-                    response.headers.get('X-Content-Security-Policy') or
-                    response.headers.get('X-WebKit-CSP')
+            # Headers only, so HEAD is enough; some servers refuse it, in
+            # which case fall back to a GET closed before the body is read
+            response = self.session.head(target, allow_redirects=True, timeout=self.timeout)
+            if response.status_code in (405, 501):
+                response = self.session.get(
+                    target, allow_redirects=True, stream=True, timeout=self.timeout
                 )
-            
-            logger.debug(f"Retrieved {len([v for v in headers.values() if v])} security headers")
-        
+                response.close()
         except requests.RequestException as e:
             logger.error(f"Failed to fetch headers: {e}")
+            return {}
         
-        return headers
+        return self.extract_headers(response)
     
-    def check_cookies(self, target: str) -> List[Dict]:
+    def check_cookies(self, target: str, response: Optional[requests.Response] = None) -> List[Dict]:
         """
         Check cookie security flags.
         
         Args:
             target: Target URL
+            response: Already-fetched response for the target; passed by
+                scan() so the cookie check shares its single GET
         
         Returns:
             List of cookie findings
         """
+        is_https = urlparse(target).scheme == 'https'
+        findings = self._cookie_findings(target, response, is_https)
+        return [finding.to_dict() for finding in findings]
+    
+    @staticmethod
+    def _raw_set_cookies(response: requests.Response) -> List[str]:
+        """
+        Raw Set-Cookie header lines from the final response.
+        
+        Reads the underlying urllib3 headers when available so repeated
+        cookie names are not collapsed; falls back to the merged
+        requests header view otherwise.
+        """
+        raw = getattr(response.raw, 'headers', None)
+        if raw is not None and hasattr(raw, 'get_all'):
+            return raw.get_all('Set-Cookie') or []
+        
+        merged = response.headers.get('Set-Cookie')
+        return [merged] if merged else []
+    
+    def _cookie_findings(
+        self,
+        target: str,
+        response: Optional[requests.Response],
+        is_https: bool
+    ) -> List[Finding]:
+        """Build cookie findings; fetches the target if no response given."""
         findings = []
         
         try:
-            response = self.session.get(target)
+            if response is None:
+                # Cookies arrive with the headers; never read the body
+                response = self.session.get(target, stream=True, timeout=self.timeout)
+                response.close()
             
-            cookies = response.cookies
-            is_https = urlparse(target).scheme == 'https'
-            
-            if cookies:
-                for cookie in cookies:
-                    issues = []
-                    
-                    # Check Secure flag (only relevant for HTTPS sites)
-                    if is_https and not cookie.secure:
-                        issues.append('missing Secure flag')
-                    
-                    # Check HttpOnly flag
-                    if not cookie.has_nonstandard_attr('HttpOnly'):
-                        issues.append('missing HttpOnly flag')
+            for raw_cookie in self._raw_set_cookies(response):
+                name, _, remainder = raw_cookie.partition('=')
+                name = name.strip()
+                if not name:
+                    continue
+                
+                # Directive tokens after the name=value pair, lowered
+                # once; this is all the flag checks need, without the
+                # http.cookiejar parsing machinery behind
+                # response.cookies
+                tokens = [t.strip().lower() for t in remainder.split(';')[1:]]
+                token_set = set(tokens)
+                secure = 'secure' in token_set
+                samesite = next(
+                    (t[len('samesite='):] for t in tokens if t.startswith('samesite=')),
+                    None
+                )
+                
+                issues = []
+                flags = []
+                
+                # Check Secure flag (only relevant for HTTPS sites)
+                missing_secure = is_https and not secure
+                if missing_secure:
+                    issues.append('missing Secure flag')
+                    flags.append('missing_secure')
+                
+                # Check HttpOnly flag
+                missing_httponly = 'httponly' not in token_set
+                if missing_httponly:
+                    issues.append('missing HttpOnly flag')
+                    flags.append('missing_httponly')
+                
+                # Check SameSite attribute
+                missing_samesite = not samesite
+                samesite_none_insecure = samesite == 'none' and not secure
+                if missing_samesite:
+                    issues.append('missing SameSite attribute')
+                    flags.append('missing_samesite')
+                elif samesite_none_insecure:
+                    issues.append('SameSite=None without Secure flag')
+                    flags.append('samesite_none_insecure')
+                
+                if issues:
+                    # Severity and recommendation derive from the
+                    # flags directly; the issue text is joined once
+                    issues_text = ', '.join(issues)
+                    needs_secure = missing_secure or samesite_none_insecure
+                    severity_level = max(_COOKIE_FLAG_SEVERITY[flag] for flag in flags)
                     
-                    # Check SameSite attribute
-                    samesite = cookie.get_nonstandard_attr('SameSite')
-                    if not samesite:
-                        issues.append('missing SameSite attribute')
-                    elif samesite.lower() == 'none' and not cookie.secure:
-                        issues.append('SameSite=None without Secure flag')
+                    # Emit only the applicable lines; the old f-string
+                    # ternaries left blank lines for satisfied flags
+                    rec_lines = [f"Set proper cookie flags for '{name}':"]
+                    if needs_secure:
+                        rec_lines.append('- Add Secure flag (HTTPS only)')
+                    if missing_httponly:
+                        rec_lines.append('- Add HttpOnly flag (prevent JavaScript access)')
+                    if missing_samesite or samesite_none_insecure:
+                        rec_lines.append('- Add SameSite attribute (Strict or Lax)')
                     
-                    if issues:
-                        findings.append({
-                            'id': 'ARGUS-WP-052',
-                            'title': f'Insecure cookie: {cookie.name}',
-                            'severity': 'medium' if 'Secure' in issues[0] or 'HttpOnly' in issues[0] else 'low',
-                            'confidence': 'high',
-                            'description': f"Cookie '{cookie.name}' has security issues: {', '.join(issues)}.",
-                            'evidence': {
-                                'type': 'header',
-                                'value': f'Set-Cookie: {cookie.name}',
-                                'context': f'Issues: {", ".join(issues)}'
-                            },
-                            'recommendation': (
-                                f"Set proper cookie flags for '{cookie.name}':\n"
-                                f"{'- Add Secure flag (HTTPS only)' if 'Secure' in ' '.join(issues) else ''}\n"
-                                f"{'- Add HttpOnly flag (prevent JavaScript access)' if 'HttpOnly' in ' '.join(issues) else ''}\n"
-                                f"{'- Add SameSite attribute (Strict or Lax)' if 'SameSite' in ' '.join(issues) else ''}"
-                            ),
-                            'references': [
-                                'https://owasp.org/www-community/controls/SecureCookieAttribute',
-                                'https://developer.mozilla.org/en-US/docs/Web/HTTP/Cookies'
-                            ]
-                        })
-        
+                    findings.append(Finding(
+                        id='ARGUS-WP-052',
+                        title=f'Insecure cookie: {name}',
+                        severity='medium' if severity_level >= 2 else 'low',
+                        confidence='high',
+                        description=f"Cookie '{name}' has security issues: {issues_text}.",
+                        evidence={
+                            'type': 'header',
+                            'value': f'Set-Cookie: {name}',
+                            'context': f'Issues: {issues_text}'
+                        },
+                        recommendation='\n'.join(rec_lines),
+                        references=_COOKIE_REFS
+                    ))
+    
         except Exception as e:
             logger.debug(f"Cookie check failed: {e}")
         
@@ -211,111 +388,142 @@ class SecurityHeadersChecker:
         Returns:
             List of findings
         """
+        now = time.monotonic()
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(target)
+            if cached and cached[0] > now:
+                logger.debug("Returning cached header scan for %s", target)
+                return copy.deepcopy(cached[1])
+        
         findings = []
+        # Parsed once here; every consumer below (header loop, cookie
+        # check) receives is_https instead of re-running urlparse
         is_https = urlparse(target).scheme == 'https'
         
-        # Fetch headers
-        headers = self.check_headers(target)
+        # One GET serves both the header extraction and the cookie check
+        # below; a failed fetch degrades exactly like the old per-check
+        # requests did (no headers, no cookies)
+        response = None
+        headers = {}
+        try:
+            # Stream and close without reading: status, headers and
+            # cookies are all available before the body transfers, and
+            # the body is never consumed by this module
+            response = self.session.get(
+                target, allow_redirects=True, stream=True, timeout=self.timeout
+            )
+            response.close()
+            headers = self.extract_headers(response)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch headers: {e}")
         
-        # Check each header
-        missing_headers = []
-        present_headers = []
-        weak_headers = []
+        # Check each header; only the counts are ever consumed, so plain
+        # counters replace the three parallel lists
+        missing_count = 0
+        present_count = 0
+        weak_count = 0
         
-        for header_name, config in self.HEADER_CONFIGS.items():
-            value = headers.get(header_name)
+        for spec in self.HEADER_SPECS:
+            value = headers.get(spec.name)
             
             # Skip HTTPS-only headers if site is HTTP
-            if config['only_https'] and not is_https:
+            if spec.only_https and not is_https:
                 continue
             
             if not value:
-                missing_headers.append(header_name)
+                missing_count += 1
                 
-                findings.append({
-                    'id': 'ARGUS-WP-050',
-                    'title': f'Missing security header: {config["name_display"]}',
-                    'severity': config['severity_missing'],
-                    'confidence': 'high',
-                    'description': (
-                        f"{config['name_display']} header is not set. "
-                        f"{config['description']}"
+                findings.append(Finding(
+                    id='ARGUS-WP-050',
+                    title=f'Missing security header: {spec.display}',
+                    severity=spec.severity_missing,
+                    confidence='high',
+                    description=(
+                        f"{spec.display} header is not set. "
+                        f"{spec.description}"
                     ),
-                    'evidence': {
+                    evidence={
                         'type': 'header',
-                        'value': f'{header_name}: [not set]',
+                        'value': f'{spec.name}: [not set]',
                         'context': 'Header missing in HTTP response'
                     },
-                    'recommendation': config['recommendation'],
-                    'references': [
-                        'https://owasp.org/www-project-secure-headers/',
-                        'https://securityheaders.com/'
-                    ]
-                })
+                    recommendation=spec.recommendation,
+                    references=_HEADER_REFS
+                ))
             
             else:
-                present_headers.append(header_name)
+                present_count += 1
                 
                 # Validate header value
-                issues = self._validate_header(header_name, value)
+                issues = self._validate_header(spec.name, value)
                 
                 if issues:
-                    weak_headers.append(header_name)
+                    weak_count += 1
                     
-                    findings.append({
-                        'id': 'ARGUS-WP-051',
-                        'title': f'Weak {config["name_display"]} configuration',
-                        'severity': 'low',
-                        'confidence': 'medium',
-                        'description': f"{config['name_display']}: {', '.join(issues)}",
-                        'evidence': {
+                    findings.append(Finding(
+                        id='ARGUS-WP-051',
+                        title=f'Weak {spec.display} configuration',
+                        severity='low',
+                        confidence='medium',
+                        description=f"{spec.display}: {', '.join(issues)}",
+                        evidence={
                             'type': 'header',
-                            'value': f'{header_name}: {value[:100]}...' if len(value) > 100 else f'{header_name}: {value}',
+                            'value': f'{spec.name}: {value[:100]}...' if len(value) > 100 else f'{spec.name}: {value}',
                             'context': f'Issues: {", ".join(issues)}'
                         },
-                        'recommendation': f'Review and strengthen {header_name} configuration. ' + config['recommendation']
-                    })
+                        recommendation=f'Review and strengthen {spec.name} configuration. ' + spec.recommendation
+                    ))
         
-        # Check cookies
-        cookie_findings = self.check_cookies(target)
+        # Check cookies on the same response, and only when it actually
+        # set any - static front pages commonly send no Set-Cookie at all
+        cookie_findings = []
+        if response is not None and self._raw_set_cookies(response):
+            cookie_findings = self._cookie_findings(target, response, is_https)
         findings.extend(cookie_findings)
         
         # Summary finding
-        if missing_headers or weak_headers or cookie_findings:
-            total_issues = len(missing_headers) + len(weak_headers) + len(cookie_findings)
+        cookie_count = len(cookie_findings)
+        if missing_count or weak_count or cookie_count:
+            total_issues = missing_count + weak_count + cookie_count
             
-            findings.append({
-                'id': 'ARGUS-WP-053',
-                'title': f'{total_issues} security header/cookie issue(s) detected',
-                'severity': 'medium' if missing_headers else 'low',
-                'confidence': 'high',
-                'description': (
-                    f"Found {len(missing_headers)} missing headers, "
-                    f"{len(weak_headers)} weak headers, "
-                    f"and {len(cookie_findings)} insecure cookies."
+            findings.append(Finding(
+                id='ARGUS-WP-053',
+                title=f'{total_issues} security header/cookie issue(s) detected',
+                severity='medium' if missing_count else 'low',
+                confidence='high',
+                description=(
+                    f"Found {missing_count} missing headers, "
+                    f"{weak_count} weak headers, "
+                    f"and {cookie_count} insecure cookies."
                 ),
-                'recommendation': (
-                    'Implement security headers best practices:\n'
-                    '1. Add all missing security headers\n'
-                    '2. Strengthen weak header configurations\n'
-                    '3. Set proper cookie security flags\n'
-                    '4. Test configuration at https://securityheaders.com/\n'
-                    '5. Use WordPress security plugins for easy header management'
-                )
-            })
+                recommendation=_REC_BEST_PRACTICES
+            ))
         
         else:
             # Good security posture
-            findings.append({
-                'id': 'ARGUS-WP-050',
-                'title': 'Security headers properly configured',
-                'severity': 'info',
-                'confidence': 'high',
-                'description': f'All {len(present_headers)} critical security headers are present.',
-                'recommendation': 'Continue monitoring and updating security header configurations.'
-            })
+            findings.append(Finding(
+                id='ARGUS-WP-050',
+                title='Security headers properly configured',
+                severity='info',
+                confidence='high',
+                description=f'All {present_count} critical security headers are present.',
+                recommendation='Continue monitoring and updating security header configurations.'
+            ))
         
-        return findings
+        # Dicts only at the scan boundary; findings stay slotted
+        # dataclasses internally
+        results = [finding.to_dict() for finding in findings]
+        
+        # Only cache results backed by a real response; a failed fetch
+        # flags every header as missing and that artifact must not be
+        # replayed for the whole TTL
+        if response is not None:
+            with _SCAN_CACHE_LOCK:
+                if len(_SCAN_CACHE) >= _SCAN_CACHE_MAX:
+                    _SCAN_CACHE.clear()
+                _SCAN_CACHE[target] = (now + _SCAN_CACHE_TTL, copy.deepcopy(results))
+
+        return results
     
     def _validate_header(self, header_name: str, value: str) -> List[str]:
         """
@@ -332,28 +540,30 @@ class SecurityHeadersChecker:
         value_lower = value.lower()
         
         if header_name == 'Strict-Transport-Security':
-            # Check max-age
-            if 'max-age' not in value_lower:
+            # One split pass classifies the directives; no per-check
+            # substring scans of the full value
+            directives = {d.strip() for d in value_lower.split(';')}
+            
+            match = _MAX_AGE_RE.search(value_lower)
+            if match is None:
                 issues.append('missing max-age directive')
-            elif 'max-age=0' in value_lower:
-                issues.append('max-age set to 0 (ineffective)')
             else:
-                import re
-                match = re.search(r'max-age=(\d+)', value_lower)
-                if match:
-                    max_age = int(match.group(1))
-                    if max_age < 31536000:  # 1 year
-                        issues.append(f'max-age too short ({max_age}s, recommend 31536000+)')
+                max_age = int(match.group(1))
+                if max_age == 0:
+                    issues.append('max-age set to 0 (ineffective)')
+                elif max_age < 31536000:  # 1 year
+                    issues.append(f'max-age too short ({max_age}s, recommend 31536000+)')
             
             # Check includeSubDomains
-            if 'includesubdomains' not in value_lower:
+            if 'includesubdomains' not in directives:
                 issues.append('missing includeSubDomains (recommended)')
         
         elif header_name == 'Content-Security-Policy':
-            # Very basic CSP validation
-            if 'unsafe-inline' in value_lower:
+            # Very basic CSP validation; both unsafe-* probes share one pass
+            unsafe = set(_CSP_UNSAFE_RE.findall(value_lower))
+            if 'inline' in unsafe:
                 issues.append("'unsafe-inline' allows inline scripts (reduces CSP effectiveness)")
-            if 'unsafe-eval' in value_lower:
+            if 'eval' in unsafe:
                 issues.append("'unsafe-eval' allows eval() (security risk)")
             if value_lower.strip() == '':
                 issues.append('CSP is empty')
@@ -370,6 +580,53 @@ class SecurityHeadersChecker:
         return issues
 
 
+def scan_many(
+    targets: List[str],
+    concurrency: int = 8,
+    config=None,
+    http_client=None
+) -> Dict[str, List[Dict]]:
+    """
+    Run SecurityHeadersChecker.scan() across many targets concurrently.
+
+    Header scans are one request per target, so batch throughput is pure
+    I/O wait; fanning out over a shared HTTP client (one connection pool,
+    one token bucket) overlaps that wait across hosts.
+
+    Args:
+        targets: Target URLs
+        concurrency: Maximum targets scanned at once
+        config: Config instance
+        http_client: RateLimitedSession shared across all targets
+
+    Returns:
+        Mapping of target URL -> list of findings
+    """
+    results: Dict[str, List[Dict]] = {}
+
+    # One checker for the whole batch: it holds no per-target state, and
+    # sharing it means even the fallback session (when no client is
+    # injected) keeps one connection pool across all targets instead of
+    # re-handshaking per host scan
+    checker = SecurityHeadersChecker(config=config, http_client=http_client)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        future_to_target = {
+            executor.submit(checker.scan, target): target
+            for target in targets
+        }
+
+        for future in as_completed(future_to_target):
+            target = future_to_target[future]
+            try:
+                results[target] = future.result()
+            except Exception as e:
+                logger.error("Headers scan failed for %s: %s", target, e)
+                results[target] = []
+
+    return results
+
+
 if __name__ == "__main__":
     # Test headers check
     from ..core.config import Config
@@ -11,69 +11,144 @@ Author: Rodney Dhavid Jimenez Chacin (rodhnin)
 License: MIT
 """
 
+import copy
 import re
-from typing import List, Dict, Optional, Set
-from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+import uuid
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import Iterator, List, Dict, Optional, Set
+from urllib.parse import urlsplit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from ..core.logging import get_logger
 from ..core.config import get_config
+from ..core.http_client import mount_pooled_adapter
 
 logger = get_logger(__name__)
 
+# Process-local scan cache keyed by target, same shape as the headers
+# checker's. Watcher-style repeat invocations against an unchanged target
+# get their findings back without a single request; installed plugins
+# change rarely, hence the longer TTL.
+_SCAN_CACHE: Dict[str, tuple] = {}
+_SCAN_CACHE_LOCK = threading.Lock()
+_SCAN_CACHE_TTL = 3600.0
+_SCAN_CACHE_MAX = 256
+
+# Precompiled once at import; these run against every homepage / readme /
+# style.css body on the discovery hot path. The combined alternation
+# classifies plugin and theme references in a single scan of the HTML; it
+# is bytes-mode so the raw body can be scanned without decoding it (the
+# character class keeps captured names ASCII-safe).
+_COMBINED_RE = re.compile(rb'/wp-content/(plugins|themes)/([a-z0-9_-]+)/', re.IGNORECASE)
+
+# Lowercase needles matched against a lowercased body prefix, keeping the
+# lookup case-insensitive without a regex engine in the loop.
+_STABLE_TAG_NEEDLE = b'stable tag:'
+_VERSION_NEEDLE = b'version:'
+
+
+def _extract_version(body: bytes, needle: bytes) -> Optional[str]:
+    """
+    Pull the 'Stable tag: X.Y.Z' / 'Version: X.Y.Z' value out of a body.
+
+    bytes.find runs CPython's vectorized substring search, which beats the
+    regex engine by an order of magnitude for a fixed needle. The body is
+    lowercased once (a few KiB at most) to keep the match case-insensitive,
+    and the remainder of the line is validated as a dotted version number.
+    """
+    idx = body.lower().find(needle)
+    if idx == -1:
+        return None
+
+    start = idx + len(needle)
+    end = body.find(b'\n', start)
+    line = body[start:end if end != -1 else start + 32].strip()
+    # First token only, so trailing comment markers etc. don't spoil it
+    raw = line.split(None, 1)[0] if line else b''
+    if raw and raw.replace(b'.', b'').isdigit() and 1 <= raw.count(b'.') <= 2:
+        return raw.decode('ascii')
+
+    return None
+
+# Top vulnerable/popular plugins (merged with config extras at init)
+_COMMON_PLUGINS = (
+    # Security & Performance
+    'wordfence', 'jetpack', 'akismet', 'all-in-one-wp-security-and-firewall',
+    'sucuri-scanner', 'ithemes-security', 'wp-super-cache', 'w3-total-cache',
+
+    # SEO & Marketing
+    'yoast-seo', 'google-analytics-for-wordpress', 'wordpress-seo',
+    'all-in-one-seo-pack', 'redirection',
+
+    # Forms & Contact
+    'contact-form-7', 'wpforms-lite', 'ninja-forms', 'formidable',
+    'gravityforms', 'contact-form-by-supsystic',
+
+    # Page Builders
+    'elementor', 'wpbakery-visual-composer', 'beaver-builder', 'divi-builder',
+    'siteorigin-panels',
+
+    # E-commerce
+    'woocommerce', 'woocommerce-gateway-stripe', 'woocommerce-services',
+    'easy-digital-downloads', 'wp-ecommerce',
+
+    # Backup & Migration
+    'updraftplus', 'all-in-one-wp-migration', 'duplicator', 'backwpup',
+
+    # Media & Gallery
+    'nextgen-gallery', 'envira-gallery-lite', 'smush', 'regenerate-thumbnails',
+
+    # Social
+    'social-media-share-buttons', 'instagram-feed', 'facebook-for-wordpress',
+
+    # Historically Vulnerable (check these!)
+    'slider-revolution', 'revslider', 'wpdatatables', 'wp-file-manager',
+    'simple-file-list', 'email-subscribers', 'wp-google-maps',
+    'wordpress-importer', 'duplicator', 'classic-editor',
+)
+
+# Common themes
+_COMMON_THEMES = (
+    # Default WP themes
+    'twentytwentyfour', 'twentytwentythree', 'twentytwentytwo',
+    'twentytwentyone', 'twentytwenty', 'twentynineteen',
+
+    # Popular premium/free
+    'astra', 'generatepress', 'oceanwp', 'neve', 'kadence',
+    'hello-elementor', 'storefront', 'divi', 'avada', 'enfold',
+)
+
+# Plugins with a known history of severe vulnerabilities
+_KNOWN_VULN = frozenset(('slider-revolution', 'revslider', 'wp-file-manager'))
+
+# Version headers sit at the top of readme.txt / style.css; a ranged GET
+# for the first 4 KiB avoids downloading multi-hundred-KB changelogs.
+_VERSION_PREFIX_BYTES = 4096
+_VERSION_RANGE_HEADER = {'Range': f'bytes=0-{_VERSION_PREFIX_BYTES - 1}'}
+
+# Plugins that announce themselves in response headers or HTML comments of
+# the homepage. A passive hit is already confirmation, so these skip the
+# active URL probe entirely.
+_FINGERPRINTS = (
+    ('w3-total-cache', re.compile(rb'W3 Total Cache/?\s?(\d[\d.]*)?')),
+    ('wp-rocket', re.compile(rb'WP Rocket/?\s?(\d[\d.]*)?')),
+    ('wp-super-cache', re.compile(rb'WP-Super-Cache(?:/|\s)?(\d[\d.]*)?')),
+    ('yoast-seo', re.compile(rb'Yoast SEO(?: Premium)? plugin v?(\d[\d.]*)?')),
+    ('all-in-one-seo-pack', re.compile(rb'All in One SEO (?:Pack )?v?(\d[\d.]*)?')),
+)
+
 
 class PluginThemeEnumerator:
     """
     WordPress plugin and theme detection.
     """
-    
-    # Top vulnerable/popular plugins (from config + extras)
-    COMMON_PLUGINS = [
-        # Security & Performance
-        'wordfence', 'jetpack', 'akismet', 'all-in-one-wp-security-and-firewall',
-        'sucuri-scanner', 'ithemes-security', 'wp-super-cache', 'w3-total-cache',
-        
-        # SEO & Marketing
-        'yoast-seo', 'google-analytics-for-wordpress', 'wordpress-seo',
-        'all-in-one-seo-pack', 'redirection',
-        
-        # Forms & Contact
-        'contact-form-7', 'wpforms-lite', 'ninja-forms', 'formidable',
-        'gravityforms', 'contact-form-by-supsystic',
-        
-        # Page Builders
-        'elementor', 'wpbakery-visual-composer', 'beaver-builder', 'divi-builder',
-        'siteorigin-panels',
-        
-        # E-commerce
-        'woocommerce', 'woocommerce-gateway-stripe', 'woocommerce-services',
-        'easy-digital-downloads', 'wp-ecommerce',
-        
-        # Backup & Migration
-        'updraftplus', 'all-in-one-wp-migration', 'duplicator', 'backwpup',
-        
-        # Media & Gallery
-        'nextgen-gallery', 'envira-gallery-lite', 'smush', 'regenerate-thumbnails',
-        
-        # Social
-        'social-media-share-buttons', 'instagram-feed', 'facebook-for-wordpress',
-        
-        # Historically Vulnerable (check these!)
-        'slider-revolution', 'revslider', 'wpdatatables', 'wp-file-manager',
-        'simple-file-list', 'email-subscribers', 'wp-google-maps',
-        'wordpress-importer', 'duplicator', 'classic-editor',
-    ]
-    
-    # Common themes
-    COMMON_THEMES = [
-        # Default WP themes
-        'twentytwentyfour', 'twentytwentythree', 'twentytwentytwo',
-        'twentytwentyone', 'twentytwenty', 'twentynineteen',
-        
-        # Popular premium/free
-        'astra', 'generatepress', 'oceanwp', 'neve', 'kadence',
-        'hello-elementor', 'storefront', 'divi', 'avada', 'enfold',
-    ]
+
+    # Class-level aliases kept for API compatibility
+    COMMON_PLUGINS = _COMMON_PLUGINS
+    COMMON_THEMES = _COMMON_THEMES
     
     def __init__(self, config=None, http_client=None):
         """
@@ -89,33 +164,98 @@ class PluginThemeEnumerator:
         # Fallback to regular session if no client provided
         if self.session is None:
             import requests
-            self.session = requests.Session()
+            self.session = mount_pooled_adapter(
+                requests.Session(),
+                pool_maxsize=max(16, self.config.max_workers),
+            )
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
         
-        # Merge config plugins with built-in
-        self.plugins_to_check = list(set(
-            self.COMMON_PLUGINS + 
-            getattr(self.config, 'wp_common_plugins', [])
-        ))
-        
-        self.themes_to_check = list(set(
-            self.COMMON_THEMES +
-            getattr(self.config, 'wp_common_themes', [])
-        ))
+        # Merge config plugins with built-in. dict.fromkeys deduplicates in
+        # one pass while keeping insertion order, so the max_check cutoff
+        # drops the tail of the list rather than an arbitrary subset.
+        self.plugins_to_check = list(dict.fromkeys(chain(
+            self.COMMON_PLUGINS,
+            getattr(self.config, 'wp_common_plugins', ())
+        )))
+
+        self.themes_to_check = list(dict.fromkeys(chain(
+            self.COMMON_THEMES,
+            getattr(self.config, 'wp_common_themes', ())
+        )))
+
+        # (target, plugins, themes) from the last homepage discovery pass,
+        # so plugin and theme enumeration share one fetch and one scan
+        self._discovered: Optional[tuple] = None
+
+        # Whether the last discovery pass actually reached the target;
+        # scan() refuses to cache results gathered while it was down
+        self._discovery_ok = False
+
+        # Per-target catch-all signatures; see _wildcard_baseline
+        self._baseline_cache: Dict[str, Optional[tuple]] = {}
     
-    def enumerate_plugins(self, target: str, max_check: Optional[int] = None) -> List[Dict]:
+    def _probe_many(self, executor, check, target: str, names: List[str],
+                    kind: str) -> Iterator[Dict]:
+        """
+        Submit one probe per component name and yield hits as they land.
+
+        Args:
+            executor: ThreadPoolExecutor to submit into
+            check: Bound probe method (_check_plugin or _check_theme)
+            target: Target URL
+            names: Component names to probe
+            kind: 'Plugin' or 'Theme' (for logging)
+
+        Yields:
+            Component info dicts, in completion order
+        """
+        pending = set()
+        for name in names:
+            future = executor.submit(check, target, name)
+            # Carry the name on the future itself; avoids the reverse
+            # dict probe per completion that as_completed needs
+            future.component = name
+            pending.add(future)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                    if result:
+                        logger.info(f"✓ {kind} found: {result['name']} {result.get('version') or 'unknown version'}")
+                        yield result
+                except Exception as e:
+                    logger.debug(f"Error checking {kind.lower()} {future.component}: {e}")
+
+    def _probe_stream(self, executor, check, target: str, names: List[str],
+                      kind: str) -> Iterator[Dict]:
+        """Probe via the shared executor, or a bounded local pool if none."""
+        if executor is not None:
+            yield from self._probe_many(executor, check, target, names, kind)
+            return
+
+        pool_size = min(self.config.max_workers, len(names)) or 1
+        with ThreadPoolExecutor(max_workers=pool_size) as local_pool:
+            yield from self._probe_many(local_pool, check, target, names, kind)
+
+    def enumerate_plugins(self, target: str, max_check: Optional[int] = None,
+                          executor: Optional[ThreadPoolExecutor] = None) -> Iterator[Dict]:
         """
         Enumerate WordPress plugins.
-        
+
         Args:
             target: Target URL
             max_check: Maximum plugins to check (default from config)
-        
-        Returns:
-            List of findings
+            executor: Optional shared ThreadPoolExecutor; a bounded local
+                pool is created when omitted
+
+        Yields:
+            One finding per detected plugin, then a summary finding.
+            Findings stream out as probes complete instead of piling up
+            in intermediate lists.
         """
-        findings = []
         max_check = max_check or self.config.wp_max_plugins_check
         
         logger.info(f"Enumerating plugins (max: {max_check})")
@@ -124,75 +264,90 @@ class PluginThemeEnumerator:
         plugins_subset = self.plugins_to_check[:max_check]
         
         # Discover plugins from HTML first
-        discovered_plugins = self._discover_from_html(target, 'plugin')
-        
-        # Add discovered to check list (unique)
-        all_plugins = list(set(plugins_subset + discovered_plugins))[:max_check]
-        
-        logger.info(f"Checking {len(all_plugins)} plugins ({len(discovered_plugins)} discovered from HTML)")
-        
-        # Check plugins concurrently
-        found_plugins = []
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_plugin = {
-                executor.submit(self._check_plugin, target, plugin): plugin
-                for plugin in all_plugins
+        discovered_plugins, _, passive_plugins = self._discover_all(target)
+
+        # Add discovered to check list (unique, order-preserving); passive
+        # fingerprint hits are already confirmed, so probing them again
+        # would only waste requests.
+        all_plugins = [
+            plugin for plugin in islice(
+                dict.fromkeys(chain(plugins_subset, discovered_plugins)), max_check
+            )
+            if plugin not in passive_plugins
+        ]
+
+        logger.info(
+            f"Checking {len(all_plugins)} plugins ({len(discovered_plugins)} discovered "
+            f"from HTML, {len(passive_plugins)} fingerprinted passively)"
+        )
+
+        # Establish the catch-all baseline up front so worker threads only
+        # ever hit the cache
+        self._wildcard_baseline(target)
+
+        # Check plugins concurrently. Probes reuse the pooled keep-alive
+        # connections of the shared session, so the pool never needs more
+        # threads than there are candidates.
+        passive_hits = (
+            {
+                'name': name,
+                'path': f'{self._site_root(target)}/wp-content/plugins/{name}/',
+                'version': version,
+                'status_code': None
             }
-            
-            for future in as_completed(future_to_plugin):
-                plugin = future_to_plugin[future]
-                try:
-                    result = future.result()
-                    if result:
-                        found_plugins.append(result)
-                        logger.info(f"✓ Plugin found: {result['name']} {result.get('version', 'unknown version')}")
-                except Exception as e:
-                    logger.debug(f"Error checking plugin {plugin}: {e}")
-        
-        # Create findings for discovered plugins
-        if found_plugins:
-            for plugin in found_plugins:
-                severity = 'info'
-                confidence = 'high'
-                title = f"Plugin detected: {plugin['name']}"
-                
-                # Check if plugin is known vulnerable (basic check)
-                if plugin['name'] in ['slider-revolution', 'revslider', 'wp-file-manager']:
-                    severity = 'medium'
-                    title += " (historically vulnerable)"
-                
-                finding = {
-                    'id': 'ARGUS-WP-010',
-                    'title': title,
-                    'severity': severity,
-                    'confidence': confidence,
-                    'description': f"WordPress plugin '{plugin['name']}' is installed.",
-                    'evidence': {
-                        'type': 'path',
-                        'value': plugin['path'],
-                        'context': f"Version: {plugin.get('version', 'unknown')}"
-                    },
-                    'recommendation': (
-                        f"1. Verify {plugin['name']} is necessary\n"
-                        "2. Update to latest version\n"
-                        "3. Remove if unused\n"
-                        "4. Check for known CVEs: https://wpscan.com/plugins/"
-                    ),
-                    'affected_component': plugin['name']
-                }
-                
-                if plugin.get('version'):
-                    finding['affected_component'] += f" {plugin['version']}"
-                
-                findings.append(finding)
-            
-            # Summary finding
-            findings.append({
+            for name, version in passive_plugins.items()
+        )
+        check = self._check_plugin
+        if getattr(self.config, 'wp_fast_mode', False):
+            check = partial(self._check_plugin, fetch_version=False)
+
+        found_count = 0
+        for plugin in chain(passive_hits,
+                            self._probe_stream(executor, check, target,
+                                               all_plugins, 'Plugin')):
+            found_count += 1
+            severity = 'info'
+            confidence = 'high'
+            title = f"Plugin detected: {plugin['name']}"
+
+            # Check if plugin is known vulnerable (basic check)
+            if plugin['name'] in _KNOWN_VULN:
+                severity = 'medium'
+                title += " (historically vulnerable)"
+
+            finding = {
+                'id': 'ARGUS-WP-010',
+                'title': title,
+                'severity': severity,
+                'confidence': confidence,
+                'description': f"WordPress plugin '{plugin['name']}' is installed.",
+                'evidence': {
+                    'type': 'path',
+                    'value': plugin['path'],
+                    'context': f"Version: {plugin.get('version', 'unknown')}"
+                },
+                'recommendation': (
+                    f"1. Verify {plugin['name']} is necessary\n"
+                    "2. Update to latest version\n"
+                    "3. Remove if unused\n"
+                    "4. Check for known CVEs: https://wpscan.com/plugins/"
+                ),
+                'affected_component': plugin['name']
+            }
+
+            if plugin.get('version'):
+                finding['affected_component'] += f" {plugin['version']}"
+
+            yield finding
+
+        # Summary finding
+        if found_count:
+            yield {
                 'id': 'ARGUS-WP-011',
-                'title': f'{len(found_plugins)} plugin(s) detected',
+                'title': f'{found_count} plugin(s) detected',
                 'severity': 'info',
                 'confidence': 'high',
-                'description': f"Found {len(found_plugins)} WordPress plugins installed.",
+                'description': f"Found {found_count} WordPress plugins installed.",
                 'recommendation': (
                     'Review all plugins:\n'
                     '- Remove unused plugins\n'
@@ -200,118 +355,131 @@ class PluginThemeEnumerator:
                     '- Monitor for security updates\n'
                     '- Use only reputable plugins from WordPress.org'
                 )
-            })
-        
-        return findings
+            }
     
-    def enumerate_themes(self, target: str, max_check: Optional[int] = None) -> List[Dict]:
+    def enumerate_themes(self, target: str, max_check: Optional[int] = None,
+                         executor: Optional[ThreadPoolExecutor] = None) -> Iterator[Dict]:
         """
         Enumerate WordPress themes.
-        
+
         Args:
             target: Target URL
             max_check: Maximum themes to check (default from config)
-        
-        Returns:
-            List of findings
+            executor: Optional shared ThreadPoolExecutor; a bounded local
+                pool is created when omitted
+
+        Yields:
+            One finding per detected theme, then a summary finding
         """
-        findings = []
         max_check = max_check or self.config.wp_max_themes_check
         
         logger.info(f"Enumerating themes (max: {max_check})")
         
-        # Discover from HTML
-        discovered_themes = self._discover_from_html(target, 'theme')
-        
-        # Combine with common themes
-        all_themes = list(set(self.themes_to_check[:max_check] + discovered_themes))[:max_check]
+        # Discover from HTML (shares the homepage fetch with plugin enumeration)
+        _, discovered_themes, _ = self._discover_all(target)
+
+        # Combine with common themes (unique, order-preserving)
+        all_themes = list(islice(
+            dict.fromkeys(chain(self.themes_to_check, discovered_themes)), max_check
+        ))
         
         logger.info(f"Checking {len(all_themes)} themes ({len(discovered_themes)} discovered from HTML)")
         
         # Check themes concurrently
-        found_themes = []
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_theme = {
-                executor.submit(self._check_theme, target, theme): theme
-                for theme in all_themes
+        self._wildcard_baseline(target)
+        check = self._check_theme
+        if getattr(self.config, 'wp_fast_mode', False):
+            check = partial(self._check_theme, fetch_version=False)
+
+        found_count = 0
+        for theme in self._probe_stream(executor, check, target, all_themes, 'Theme'):
+            found_count += 1
+            yield {
+                'id': 'ARGUS-WP-020',
+                'title': f"Theme detected: {theme['name']}",
+                'severity': 'info',
+                'confidence': 'high',
+                'description': f"WordPress theme '{theme['name']}' is installed.",
+                'evidence': {
+                    'type': 'path',
+                    'value': theme['path'],
+                    'context': f"Version: {theme.get('version', 'unknown')}"
+                },
+                'recommendation': (
+                    f"1. Update {theme['name']} to latest version\n"
+                    "2. Remove unused themes (keep only active + one backup)\n"
+                    "3. Use child themes for customizations"
+                ),
+                'affected_component': f"{theme['name']} theme"
             }
-            
-            for future in as_completed(future_to_theme):
-                theme = future_to_theme[future]
-                try:
-                    result = future.result()
-                    if result:
-                        found_themes.append(result)
-                        logger.info(f"✓ Theme found: {result['name']} {result.get('version', '')}")
-                except Exception as e:
-                    logger.debug(f"Error checking theme {theme}: {e}")
-        
-        # Create findings
-        if found_themes:
-            for theme in found_themes:
-                findings.append({
-                    'id': 'ARGUS-WP-020',
-                    'title': f"Theme detected: {theme['name']}",
-                    'severity': 'info',
-                    'confidence': 'high',
-                    'description': f"WordPress theme '{theme['name']}' is installed.",
-                    'evidence': {
-                        'type': 'path',
-                        'value': theme['path'],
-                        'context': f"Version: {theme.get('version', 'unknown')}"
-                    },
-                    'recommendation': (
-                        f"1. Update {theme['name']} to latest version\n"
-                        "2. Remove unused themes (keep only active + one backup)\n"
-                        "3. Use child themes for customizations"
-                    ),
-                    'affected_component': f"{theme['name']} theme"
-                })
-            
-            findings.append({
+
+        if found_count:
+            yield {
                 'id': 'ARGUS-WP-021',
-                'title': f'{len(found_themes)} theme(s) detected',
+                'title': f'{found_count} theme(s) detected',
                 'severity': 'info',
                 'confidence': 'high',
-                'description': f"Found {len(found_themes)} WordPress themes installed.",
+                'description': f"Found {found_count} WordPress themes installed.",
                 'recommendation': 'Keep only necessary themes installed and updated.'
-            })
-        
-        return findings
+            }
     
-    def _discover_from_html(self, target: str, component_type: str) -> List[str]:
+    def _discover_all(self, target: str) -> tuple:
         """
-        Discover plugins/themes from HTML source.
-        
+        Discover plugins and themes from the HTML source in one pass.
+
+        Fetches the homepage once per target (memoized on the instance) and
+        classifies every /wp-content/ component reference with a single
+        combined regex scan. Also runs the passive fingerprint table over
+        the response headers and body, so plugins that leak their identity
+        there never need an active probe.
+
         Args:
             target: Target URL
-            component_type: 'plugin' or 'theme'
-        
+
         Returns:
-            List of discovered component names
+            Tuple of (plugin names as set, theme names as set,
+            passively fingerprinted plugins as {name: version or None})
         """
-        discovered = set()
-        
+        if self._discovered is not None and self._discovered[0] == target:
+            return self._discovered[1], self._discovered[2], self._discovered[3]
+
+        plugins: Set[str] = set()
+        themes: Set[str] = set()
+        passive: Dict[str, Optional[str]] = {}
+
         try:
             response = self.session.get(target)
-            
+            # Any response at all means the host is up; a non-200 homepage
+            # still leaves the active probes worth running (and caching)
+            self._discovery_ok = True
+
             if response.status_code == 200:
-                if component_type == 'plugin':
-                    # Look for /wp-content/plugins/NAME/
-                    pattern = r'/wp-content/plugins/([a-z0-9-_]+)/'
-                else:  # theme
-                    # Look for /wp-content/themes/NAME/
-                    pattern = r'/wp-content/themes/([a-z0-9-_]+)/'
-                
-                matches = re.findall(pattern, response.text, re.IGNORECASE)
-                discovered.update(matches)
-        
+                for match in _COMBINED_RE.finditer(response.content):
+                    if match.group(1).lower() == b'plugins':
+                        plugins.add(match.group(2).decode('ascii'))
+                    else:
+                        themes.add(match.group(2).decode('ascii'))
+
+                header_blob = '\n'.join(
+                    f'{name}: {value}' for name, value in response.headers.items()
+                ).encode('latin-1', 'replace')
+
+                for name, pattern in _FINGERPRINTS:
+                    for haystack in (header_blob, response.content):
+                        match = pattern.search(haystack)
+                        if match:
+                            version = match.group(1)
+                            passive[name] = version.decode('ascii') if version else None
+                            break
+
         except Exception as e:
             logger.debug(f"HTML discovery failed: {e}")
-        
-        return list(discovered)
+
+        self._discovered = (target, plugins, themes, passive)
+        return plugins, themes, passive
     
-    def _check_plugin(self, target: str, plugin_name: str) -> Optional[Dict]:
+    def _check_plugin(self, target: str, plugin_name: str,
+                      fetch_version: bool = True) -> Optional[Dict]:
         """
         Check if a specific plugin exists.
         
@@ -322,30 +490,23 @@ class PluginThemeEnumerator:
         Returns:
             Dict with plugin info or None if not found
         """
-        plugin_url = urljoin(target, f'/wp-content/plugins/{plugin_name}/')
-        
-        # Try to access plugin directory
-        try:
-            response = self.session.get(plugin_url, allow_redirects=False)
-            
-            # 200 = directory listing, 403 = exists but forbidden
-            if response.status_code in [200, 403]:
-                # Try to get version from readme.txt
-                version = self._get_plugin_version(target, plugin_name)
-                
-                return {
-                    'name': plugin_name,
-                    'path': plugin_url,
-                    'version': version,
-                    'status_code': response.status_code
-                }
-        
-        except Exception as e:
-            logger.debug(f"Plugin check failed for {plugin_name}: {e}")
-        
-        return None
+        base = self._site_root(target)
+        plugin_url = f'{base}/wp-content/plugins/{plugin_name}/'
+        readme_url = f'{plugin_url}readme.txt'
+        wildcard = self._wildcard_baseline(target) is not None
+        # An HTML-discovered plugin is already confirmed; its probe only
+        # chases the version
+        confirmed = (self._discovered is not None
+                     and self._discovered[0] == target
+                     and plugin_name in self._discovered[1])
+        return self._probe_component(plugin_name, plugin_url, readme_url,
+                                     _STABLE_TAG_NEEDLE,
+                                     wildcard=wildcard,
+                                     confirmed=confirmed,
+                                     fetch_version=fetch_version)
     
-    def _check_theme(self, target: str, theme_name: str) -> Optional[Dict]:
+    def _check_theme(self, target: str, theme_name: str,
+                     fetch_version: bool = True) -> Optional[Dict]:
         """
         Check if a specific theme exists.
         
@@ -356,60 +517,168 @@ class PluginThemeEnumerator:
         Returns:
             Dict with theme info or None if not found
         """
-        theme_url = urljoin(target, f'/wp-content/themes/{theme_name}/')
-        
+        base = self._site_root(target)
+        theme_url = f'{base}/wp-content/themes/{theme_name}/'
+        style_url = f'{theme_url}style.css'
+        wildcard = self._wildcard_baseline(target) is not None
+        confirmed = (self._discovered is not None
+                     and self._discovered[0] == target
+                     and theme_name in self._discovered[2])
+        return self._probe_component(theme_name, theme_url, style_url,
+                                     _VERSION_NEEDLE,
+                                     wildcard=wildcard,
+                                     confirmed=confirmed,
+                                     fetch_version=fetch_version)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _site_root(target: str) -> str:
+        """
+        Scheme + host of the target, which all probe URLs hang off.
+
+        Replaces per-probe urljoin calls, each of which re-parsed the
+        target URL; the result is memoized because every probe in a scan
+        asks for the same few targets.
+        """
+        split = urlsplit(target)
+        if split.scheme and split.netloc:
+            return f'{split.scheme}://{split.netloc}'
+        return target.rstrip('/')
+
+    def _wildcard_baseline(self, target: str) -> Optional[tuple]:
+        """
+        Detect catch-all rewrites under /wp-content/plugins/.
+
+        Requests a plugin directory that cannot exist; if the host answers
+        200/403 anyway, every directory probe on this target is noise and
+        only a version-file match counts as confirmation.
+
+        Args:
+            target: Target URL
+
+        Returns:
+            (status, body length, hash of first 256 bytes) when the host
+            answers the garbage path, None when it 404s normally
+        """
+        if target in self._baseline_cache:
+            return self._baseline_cache[target]
+
+        garbage_url = (
+            f'{self._site_root(target)}/wp-content/plugins/'
+            f'argus-nonexistent-{uuid.uuid4().hex}/'
+        )
+        signature = None
+
         try:
-            response = self.session.get(theme_url, allow_redirects=False)
-            
+            response = self.session.get(garbage_url, allow_redirects=False)
+            if response.status_code in (200, 403):
+                signature = (
+                    response.status_code,
+                    len(response.content),
+                    hash(response.content[:256]),
+                )
+                logger.info(
+                    f"Catch-all response detected (HTTP {response.status_code} for "
+                    "a nonexistent plugin); directory probes disabled for this target"
+                )
+        except Exception as e:
+            logger.debug(f"Baseline probe failed: {e}")
+
+        self._baseline_cache[target] = signature
+        return signature
+
+    def _probe_component(self, name: str, dir_url: str, version_url: str,
+                         needle: bytes,
+                         wildcard: bool = False, confirmed: bool = False,
+                         fetch_version: bool = True) -> Optional[Dict]:
+        """
+        Probe a component via its version file, falling back to the directory.
+
+        A 200 on readme.txt/style.css both proves the component exists and
+        carries its version, so the hit path costs one request instead of
+        an existence probe plus a version fetch. Only when the version file
+        is missing or blocked does the directory HEAD probe run.
+
+        Args:
+            name: Component directory name
+            dir_url: Component directory URL
+            version_url: readme.txt / style.css URL
+            needle: Literal lowercase version-header prefix to search for
+            wildcard: Target answers nonexistent paths with 200/403, so
+                status codes alone prove nothing
+            confirmed: Existence already proven (e.g. referenced in the
+                homepage HTML); only the version is still wanted
+            fetch_version: When False (fast mode), settle for the cheaper
+                body-less existence probe; ignored on catch-all hosts
+                where the version file is the only reliable signal
+
+        Returns:
+            Dict with component info or None if not found
+        """
+        try:
+            if fetch_version or wildcard:
+                response = self.session.get(
+                    version_url, allow_redirects=False, headers=_VERSION_RANGE_HEADER
+                )
+
+                # 206 = ranged response honored, 200 = range ignored (full body)
+                if response.status_code in (200, 206):
+                    version = _extract_version(
+                        response.content[:_VERSION_PREFIX_BYTES], needle
+                    )
+                    if version is not None or not wildcard:
+                        return {
+                            'name': name,
+                            'path': dir_url,
+                            'version': version,
+                            'status_code': response.status_code
+                        }
+                    # Catch-all hosts serve a page for any URL; without a
+                    # version header this is not a real readme/style.css
+
+                if confirmed:
+                    # The component is there even if its version file is
+                    # not readable; no further probing needed
+                    return {
+                        'name': name,
+                        'path': dir_url,
+                        'version': None,
+                        'status_code': response.status_code
+                    }
+
+                if wildcard:
+                    # Directory status codes carry no signal on this host
+                    return None
+
+            elif confirmed:
+                return {
+                    'name': name,
+                    'path': dir_url,
+                    'version': None,
+                    'status_code': None
+                }
+
+            # Version file unavailable; the directory itself may still
+            # answer. Only the status code matters here, so HEAD.
+            response = self.session.head(dir_url, allow_redirects=False)
+
+            if response.status_code in (405, 501):
+                # Server rejects HEAD; retry once with a body-less GET
+                response = self.session.get(dir_url, allow_redirects=False, stream=True)
+                response.close()
+
+            # 200 = directory listing, 403 = exists but forbidden
             if response.status_code in [200, 403]:
-                version = self._get_theme_version(target, theme_name)
-                
                 return {
-                    'name': theme_name,
-                    'path': theme_url,
-                    'version': version,
+                    'name': name,
+                    'path': dir_url,
+                    'version': None,
                     'status_code': response.status_code
                 }
-        
+
         except Exception as e:
-            logger.debug(f"Theme check failed for {theme_name}: {e}")
-        
-        return None
-    
-    def _get_plugin_version(self, target: str, plugin_name: str) -> Optional[str]:
-        """Extract plugin version from readme.txt."""
-        readme_url = urljoin(target, f'/wp-content/plugins/{plugin_name}/readme.txt')
-        
-        try:
-            response = self.session.get(readme_url)
-            
-            if response.status_code == 200:
-                # Look for "Stable tag: X.Y.Z"
-                match = re.search(r'Stable tag:\s*(\d+\.\d+(?:\.\d+)?)', response.text, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-        
-        except Exception:
-            pass
-        
-        return None
-    
-    def _get_theme_version(self, target: str, theme_name: str) -> Optional[str]:
-        """Extract theme version from style.css."""
-        style_url = urljoin(target, f'/wp-content/themes/{theme_name}/style.css')
-        
-        try:
-            response = self.session.get(style_url)
-            
-            if response.status_code == 200:
-                # Look for "Version: X.Y.Z" in CSS header
-                match = re.search(r'Version:\s*(\d+\.\d+(?:\.\d+)?)', response.text, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-        
-        except Exception:
-            pass
-        
+            logger.debug(f"Component check failed for {name}: {e}")
+
         return None
     
     def scan(self, target: str) -> List[Dict]:
@@ -422,14 +691,34 @@ class PluginThemeEnumerator:
         Returns:
             List of findings
         """
+        now = time.monotonic()
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(target)
+            if cached and cached[0] > now:
+                logger.debug("Returning cached enumeration for %s", target)
+                return copy.deepcopy(cached[1])
+
         all_findings = []
-        
-        # Enumerate plugins
-        plugin_findings = self.enumerate_plugins(target)
-        all_findings.extend(plugin_findings)
-        
-        # Enumerate themes
-        theme_findings = self.enumerate_themes(target)
-        all_findings.extend(theme_findings)
-        
+
+        # Fresh discovery pass per scan invocation
+        self._discovered = None
+        self._discovery_ok = False
+
+        # One worker pool serves both enumerations; spawning and tearing
+        # down a second pool per scan bought nothing.
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            all_findings.extend(self.enumerate_plugins(target, executor=executor))
+            all_findings.extend(self.enumerate_themes(target, executor=executor))
+
+        # Never cache a scan taken while the target was unreachable: an
+        # empty result from a down site would otherwise mask real
+        # findings for the whole TTL once it comes back
+        if self._discovery_ok:
+            with _SCAN_CACHE_LOCK:
+                if len(_SCAN_CACHE) >= _SCAN_CACHE_MAX:
+                    _SCAN_CACHE.clear()
+                _SCAN_CACHE[target] = (now + _SCAN_CACHE_TTL, copy.deepcopy(all_findings))
+        else:
+            logger.debug("Target unreachable during scan; not caching %s", target)
+
         return all_findings
@@ -12,16 +12,39 @@ License: MIT
 """
 
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from typing import List, Dict, Set, Optional
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from ..core.logging import get_logger
 from ..core.config import get_config
+from ..core.http_client import mount_pooled_adapter
 
 logger = get_logger(__name__)
 
+# Compiled once at import; runs per page inside the IDOR sweep.
+_AUTHOR_TEXT_RE = re.compile(r'Author[:\s]+(\w+)', re.IGNORECASE)
+
+_AUTHOR_PATH_MARKER = '/author/'
+
+# XPath expressions compiled once at import. The union expression grabs
+# every username-bearing candidate node in one libxml2 traversal; the few
+# returned nodes are then bucketed by tag in Python so the extraction
+# priority (H1 title, body class, meta, span, rel=author) is preserved.
+_USERNAME_CANDIDATES_XPATH = etree.XPath(
+    "//h1[contains(@class,'wp-block-query-title') or "
+    "contains(@class,'archive-title') or contains(@class,'page-title')]"
+    " | //body[@class]"
+    " | //meta[@name='author']"
+    " | //span[contains(@class,'author') or contains(@class,'vcard')]"
+    " | //a[@rel='author']"
+)
+_POST_AUTHOR_HREF_XPATH = etree.XPath("//a[contains(@href,'/author/')]/@href")
+
 
 class UserEnumerator:
     """
@@ -34,16 +57,22 @@ class UserEnumerator:
         
         Args:
             config: Config instance
-            http_client: RateLimitedSession instance
+            http_client: RateLimitedSession instance (expected to sit on a
+                pooled session so the IDOR sweep reuses connections)
         """
         self.config = config or get_config()
         self.session = http_client  # Use rate-limited client
         self.discovered_users = set()
-        
-        # Fallback to regular session if no client provided
+
+        # Fallback to regular session if no client provided. The pooled
+        # adapter keeps TCP/TLS connections alive across the N sequential
+        # author-IDOR probes instead of re-handshaking per user ID.
         if self.session is None:
             import requests
-            self.session = requests.Session()
+            self.session = mount_pooled_adapter(
+                requests.Session(),
+                pool_maxsize=max(16, self.config.max_workers),
+            )
             self.session.headers.update({'User-Agent': self.config.user_agent})
             logger.warning("No HTTP client provided, using non-rate-limited session")
     
@@ -63,50 +92,143 @@ class UserEnumerator:
         """
         max_users = max_users or self.config.wp_max_users_check
         users = []
-        
+
         logger.info(f"Checking author IDOR enumeration (max: {max_users} users)")
-        
-        for user_id in range(1, max_users + 1):
-            user_url = urljoin(target, f'/?author={user_id}')
-            
-            try:
-                response = self.session.get(user_url, allow_redirects=True)
-                
-                username = None
-                method = None
-                final_url = response.url
-                
-                # Check if there was a redirect (older WordPress behavior)
-                if response.history and '/author/' in final_url:
-                    # Redirected from /?author=N to /author/username/
-                    username = self._extract_username_from_url(final_url)
-                    method = 'author_idor_redirect'
-                    logger.debug(f"Detected redirect: {user_url} -> {final_url}")
-                
-                # Check final URL even without redirect (WordPress 6.x+)
-                elif '/author/' in final_url and final_url != user_url:
-                    username = self._extract_username_from_url(final_url)
-                    method = 'author_idor_url'
-                
-                # Check HTML content for username (WordPress 6.x+ direct response)
-                elif response.status_code == 200:
-                    username = self._extract_username_from_html(response.text, user_id)
-                    method = 'author_idor_html'
-                
-                if username:
-                    users.append({
-                        'id': user_id,
-                        'username': username,
-                        'method': method,
-                        'url': final_url
-                    })
-                    
-                    logger.info(f"✓ User found via IDOR: {username} (ID: {user_id}, method: {method})")
-            
-            except Exception as e:
-                logger.debug(f"IDOR check failed for ID {user_id}: {e}")
-        
+
+        # Each probe is independent network I/O, so a bounded pool hides
+        # the per-request RTT; the rate-limited session still caps the
+        # actual request rate. IDs are submitted in a sliding window so
+        # the queue never holds more than ~2x the pool.
+        pool_size = min(getattr(self.config, 'wp_idor_workers', 8), max_users) or 1
+        miss_limit = getattr(self.config, 'wp_idor_miss_streak', 20)
+        id_iter = iter(range(1, max_users + 1))
+        window = pool_size * 2
+
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            pending = {}
+            outcomes: Dict[int, Optional[Dict]] = {}
+            next_fold = 1
+            misses = 0
+            stopped = False
+
+            while True:
+                if not stopped:
+                    for user_id in islice(id_iter, window - len(pending)):
+                        future = executor.submit(self._probe_author_id, target, user_id)
+                        pending[future] = user_id
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    user_id = pending.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        outcomes[user_id] = future.result()
+                    except Exception as e:
+                        logger.debug(f"IDOR check failed for ID {user_id}: {e}")
+                        outcomes[user_id] = None
+
+                # Fold outcomes in ID order so the miss streak stays
+                # well-defined despite out-of-order completion
+                while next_fold in outcomes:
+                    user = outcomes.pop(next_fold)
+                    next_fold += 1
+                    if user:
+                        users.append(user)
+                        misses = 0
+                    else:
+                        misses += 1
+
+                # WordPress IDs are densely packed at low numbers; a long
+                # run of misses means the rest of the range is dead weight
+                if misses >= miss_limit and not stopped:
+                    stopped = True
+                    logger.info(
+                        f"Stopping IDOR sweep at ID {next_fold - 1} after "
+                        f"{misses} consecutive misses"
+                    )
+                    for future in pending:
+                        future.cancel()
+
         return users
+
+    def _probe_author_id(self, target: str, user_id: int) -> Optional[Dict]:
+        """
+        Probe a single /?author=N ID.
+
+        Args:
+            target: Target URL
+            user_id: Author ID to probe
+
+        Returns:
+            User dict if the ID resolved to a username, else None
+        """
+        user_url = urljoin(target, f'/?author={user_id}')
+
+        username = None
+        method = None
+        found_url = user_url
+
+        # Redirect-capable sites (pre-6.x WordPress) put the author slug in
+        # the Location header, so a body-less HEAD answers the probe
+        # without downloading or parsing the archive page.
+        response = self.session.head(user_url, allow_redirects=False)
+
+        author_redirect = False
+        if response.status_code in (301, 302, 303, 307, 308):
+            location = response.headers.get('Location', '')
+            if '/author/' in location:
+                author_redirect = True
+                username = self._extract_username_from_url(location)
+                method = 'author_idor_redirect'
+                # Location may be relative; findings always carry the
+                # absolute URL
+                found_url = urljoin(user_url, location)
+                logger.debug(f"Detected redirect: {user_url} -> {found_url}")
+            # A redirect elsewhere (host/scheme canonicalization, e.g.
+            # non-www -> www) says nothing about the author ID; only a
+            # redirect-following GET can tell where the chain really ends.
+
+        if not author_redirect and response.status_code in (
+            200, 301, 302, 303, 307, 308, 405, 501
+        ):
+            # WordPress 6.x+ serves the author archive directly (200), the
+            # server rejects HEAD (405/501), or the redirect just
+            # canonicalizes the host/scheme; only now is the body worth
+            # fetching, following the chain to wherever it really ends
+            response = self.session.get(user_url, allow_redirects=True)
+            final_url = response.url
+            found_url = final_url
+
+            # Check if there was a redirect (older WordPress behavior)
+            if response.history and '/author/' in final_url:
+                username = self._extract_username_from_url(final_url)
+                method = 'author_idor_redirect'
+                logger.debug(f"Detected redirect: {user_url} -> {final_url}")
+
+            # Check final URL even without redirect (WordPress 6.x+)
+            elif '/author/' in final_url and final_url != user_url:
+                username = self._extract_username_from_url(final_url)
+                method = 'author_idor_url'
+
+            # Check HTML content for username (WordPress 6.x+ direct response)
+            elif response.status_code == 200:
+                username = self._extract_username_from_html(response.content, user_id)
+                method = 'author_idor_html'
+
+        if username:
+            logger.info(f"✓ User found via IDOR: {username} (ID: {user_id}, method: {method})")
+            return {
+                'id': user_id,
+                'username': username,
+                'method': method,
+                'url': found_url
+            }
+
+        return None
     
     def enumerate_via_rest_api(self, target: str) -> List[Dict]:
         """
@@ -176,16 +298,23 @@ class UserEnumerator:
             response = self.session.get(target)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
-                # Look for author links
-                author_links = soup.find_all('a', href=re.compile(r'/author/'))
-                
-                for link in author_links:
-                    href = link.get('href')
+                # Feed raw bytes to libxml2 and let it sniff the charset;
+                # response.text would run requests' own encoding detection
+                # over the whole body first
+                tree = lxml.html.fromstring(response.content)
+
+                # Harvest author link hrefs in one libxml2 pass; no DOM
+                # wrapper objects, just a list of attribute strings
+                hrefs = _POST_AUTHOR_HREF_XPATH(tree)
+
+                # Listing pages repeat the same author link per post, so
+                # dedup with a set instead of rescanning the result list
+                seen = set()
+                for href in hrefs:
                     username = self._extract_username_from_url(href)
-                    
-                    if username and username not in [u['username'] for u in users]:
+
+                    if username and username not in seen:
+                        seen.add(username)
                         users.append({
                             'username': username,
                             'method': 'post_author',
@@ -200,82 +329,96 @@ class UserEnumerator:
     
     def _extract_username_from_url(self, url: str) -> Optional[str]:
         """Extract username from author URL."""
-        # /author/username/ or /author/username
-        match = re.search(r'/author/([^/]+)', url)
-        if match:
-            return match.group(1).rstrip('/')
-        return None
+        # /author/username/ or /author/username — plain slicing, this runs
+        # once per harvested link and needs no regex machinery
+        idx = url.find(_AUTHOR_PATH_MARKER)
+        if idx == -1:
+            return None
+        start = idx + len(_AUTHOR_PATH_MARKER)
+        end = url.find('/', start)
+        slug = url[start:end] if end != -1 else url[start:]
+        return slug or None
     
-    def _extract_username_from_html(self, html: str, user_id: Optional[int] = None) -> Optional[str]:
+    def _extract_username_from_html(self, html: bytes, user_id: Optional[int] = None) -> Optional[str]:
         """
         Extract username from HTML content.
-        
+
         Enhanced for WordPress 6.x+ which doesn't redirect but shows author page directly.
-        
+
         Args:
-            html: HTML content
+            html: Raw HTML bytes (libxml2 handles charset sniffing)
             user_id: User ID being checked (for body class extraction)
         
         Returns:
             Username if found
         """
-        soup = BeautifulSoup(html, 'lxml')
-        
+        try:
+            tree = lxml.html.fromstring(html)
+        except Exception:
+            return None
+
+        # One DOM walk collects every candidate; bucket by tag so the
+        # priority order below is independent of document order
+        h1_titles = []
+        body_class = ''
+        meta_author = ''
+        spans = []
+        rel_authors = []
+        for node in _USERNAME_CANDIDATES_XPATH(tree):
+            tag = node.tag
+            if tag == 'h1':
+                h1_titles.append(node)
+            elif tag == 'body':
+                body_class = node.get('class') or ''
+            elif tag == 'meta':
+                if not meta_author:
+                    meta_author = node.get('content') or ''
+            elif tag == 'span':
+                spans.append(node)
+            else:
+                rel_authors.append(node)
+
         # WordPress 6.x+ - Check H1 title "Author: <span>username</span>"
-        h1_patterns = [
-            soup.find('h1', class_=re.compile(r'wp-block-query-title')),
-            soup.find('h1', class_=re.compile(r'archive-title|page-title')),
-        ]
-        
-        for h1 in h1_patterns:
-            if h1:
-                text = h1.get_text(strip=True)
-                # Match "Author: username" or "Author username"
-                match = re.search(r'Author[:\s]+(\w+)', text, re.IGNORECASE)
-                if match:
-                    username = match.group(1)
-                    if username.lower() not in ['author', 'by']:  # Avoid false positives
-                        logger.debug(f"Username extracted from H1: {username}")
-                        return username
-                
-                # Also check span inside H1
-                span = h1.find('span')
-                if span:
-                    username = span.get_text(strip=True)
-                    if username and len(username) < 50 and username.lower() not in ['author']:
-                        logger.debug(f"Username extracted from H1 span: {username}")
-                        return username
-        
+        for h1 in h1_titles:
+            text = h1.text_content().strip()
+            # Match "Author: username" or "Author username"
+            match = _AUTHOR_TEXT_RE.search(text)
+            if match:
+                username = match.group(1)
+                if username.lower() not in ['author', 'by']:  # Avoid false positives
+                    logger.debug(f"Username extracted from H1: {username}")
+                    return username
+
+            # Also check span inside H1
+            span = h1.find('.//span')
+            if span is not None:
+                username = span.text_content().strip()
+                if username and len(username) < 50 and username.lower() not in ['author']:
+                    logger.debug(f"Username extracted from H1 span: {username}")
+                    return username
+
         # WordPress 6.x+ - Check body classes "author author-USERNAME author-ID"
-        body = soup.find('body')
-        if body and user_id:
-            classes = body.get('class', [])
-            if isinstance(classes, str):
-                classes = classes.split()
-            
-            # Look for "author-USERNAME" pattern
-            for cls in classes:
+        if user_id:
+            for cls in body_class.split():
                 # Match "author-username" but not "author-1" (ID)
                 if cls.startswith('author-') and not cls.replace('author-', '').isdigit():
                     username = cls.replace('author-', '')
                     logger.debug(f"Username extracted from body class: {username}")
                     return username
-        
+
         # Original patterns (fallback for older WordPress)
-        patterns = [
-            ('meta', {'name': 'author'}),
-            ('span', {'class': re.compile(r'author|vcard')}),
-            ('a', {'rel': 'author'}),
-        ]
-        
-        for tag, attrs in patterns:
-            element = soup.find(tag, attrs)
-            if element:
-                content = element.get('content') or element.get_text(strip=True)
-                if content and len(content) < 50:  # Reasonable username length
-                    logger.debug(f"Username extracted from {tag}: {content}")
+        content = meta_author.strip()
+        if content and len(content) < 50:  # Reasonable username length
+            logger.debug(f"Username extracted from meta: {content}")
+            return content
+
+        for elements in (spans, rel_authors):
+            if elements:
+                content = elements[0].text_content().strip()
+                if content and len(content) < 50:
+                    logger.debug(f"Username extracted from {elements[0].tag}: {content}")
                     return content
-        
+
         return None
     
     def scan(self, target: str) -> List[Dict]:
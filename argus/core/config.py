@@ -85,9 +85,12 @@ class Config:
     wp_max_themes_check: int = 20
     wp_common_plugins: list = field(default_factory=lambda: Config.DEFAULT_COMMON_PLUGINS.copy())
     wp_common_themes: list = field(default_factory=lambda: Config.DEFAULT_COMMON_THEMES.copy())
+    wp_fast_mode: bool = False  # existence-only enumeration, skip version fetches
     wp_check_author_idor: bool = True
     wp_check_rest_api: bool = True
     wp_max_users_check: int = 10
+    wp_idor_workers: int = 8
+    wp_idor_miss_streak: int = 20  # stop the sweep after this many consecutive misses
     
     # Consent token
     token_expiry_hours: int = 48
@@ -331,12 +334,15 @@ class Config:
                 # Also handle common_plugins and common_themes
                 flat['wp_common_plugins'] = enum.get('common_plugins', cls.DEFAULT_COMMON_PLUGINS.copy())
                 flat['wp_common_themes'] = enum.get('common_themes', cls.DEFAULT_COMMON_THEMES.copy())
+                flat['wp_fast_mode'] = enum.get('fast_mode', cls.wp_fast_mode)
             
             if 'user_enumeration' in wp:
                 user_enum = wp['user_enumeration']
                 flat['wp_check_author_idor'] = user_enum.get('check_author_idor', cls.wp_check_author_idor)
                 flat['wp_check_rest_api'] = user_enum.get('check_rest_api', cls.wp_check_rest_api)
                 flat['wp_max_users_check'] = user_enum.get('max_users_to_check', cls.wp_max_users_check)
+                flat['wp_idor_workers'] = user_enum.get('idor_workers', cls.wp_idor_workers)
+                flat['wp_idor_miss_streak'] = user_enum.get('idor_miss_streak', cls.wp_idor_miss_streak)
         
         # Consent
         if 'consent' in config_dict:
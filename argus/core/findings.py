@@ -0,0 +1,70 @@
+# ============================================================================
+# argus/core/findings.py
+# ----------------------
+# Lightweight finding container shared by the check modules.
+# ============================================================================
+
+"""
+Finding Container
+
+Slotted dataclass used by check modules to build findings cheaply.
+
+A large scan allocates thousands of findings; a dict literal costs a
+full hash table plus per-key overhead for every one of them, while a
+slotted dataclass stores the fields inline. Check modules construct
+Finding objects internally and convert to plain dicts at their scan()
+boundary, so the reporting/database pipeline keeps receiving the same
+dict shape as before.
+
+Author: Rodney Dhavid Jimenez Chacin (rodhnin)
+License: MIT
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class Finding:
+    """
+    One scan finding.
+
+    Field names mirror the keys of the finding dicts used across the
+    reporting pipeline (see docs/REPORT_FORMAT.md).
+    """
+
+    id: str
+    title: str
+    severity: str
+    confidence: str = 'medium'
+    description: str = ''
+    evidence: Optional[Dict] = None
+    recommendation: str = ''
+    references: List[str] = field(default_factory=list)
+    affected_component: str = ''
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to the plain dict shape the report/DB pipeline expects.
+
+        Optional fields that were never set are omitted, matching how the
+        check modules historically built their dict literals.
+        """
+        result = {
+            'id': self.id,
+            'title': self.title,
+            'severity': self.severity,
+            'confidence': self.confidence,
+            'recommendation': self.recommendation,
+        }
+
+        if self.description:
+            result['description'] = self.description
+        if self.evidence is not None:
+            result['evidence'] = self.evidence
+        if self.references:
+            result['references'] = self.references
+        if self.affected_component:
+            result['affected_component'] = self.affected_component
+
+        return result
@@ -13,6 +13,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     import jsonschema
     HAS_JSONSCHEMA = True
@@ -247,9 +253,17 @@ class ReportGenerator:
         # Ensure directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write JSON with pretty printing
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(report, f, indent=self.config.json_indent, ensure_ascii=False)
+        # Write JSON with pretty printing. Prefer orjson when available:
+        # its C encoder is several times faster than the stdlib on large
+        # findings lists. orjson only supports 2-space indentation, so any
+        # other configured indent keeps the stdlib path.
+        if HAS_ORJSON and self.config.json_indent == 2:
+            output_path.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with output_path.open('w', encoding='utf-8') as f:
+                json.dump(report, f, indent=self.config.json_indent, ensure_ascii=False)
         
         logger.info(f"JSON report saved: {output_path}")
         return output_path